@@ -1,10 +1,43 @@
 import { zip } from 'zip-a-folder';
-import { mkdirSync } from 'fs';
+import { execFileSync } from 'child_process';
+import { createHash } from 'crypto';
+import { mkdirSync, readdirSync, readFileSync, writeFileSync } from 'fs';
+import { join } from 'path';
+
+// Content hashes of everything the game fetches, keyed by the path it is fetched by.
+// The loaders keep fetched files in the browser's Cache API under these versions,
+// so unchanged files skip the network on later page loads.
+function hashFile(path) {
+    return createHash('sha256').update(readFileSync(path)).digest('hex').slice(0, 16);
+}
+
+function hashTree(dir, hashes) {
+    for (const entry of readdirSync(dir, { withFileTypes: true })) {
+        const path = join(dir, entry.name).split('\\').join('/');
+        if (entry.isDirectory()) {
+            hashTree(path, hashes);
+        } else {
+            hashes[path] = hashFile(path);
+        }
+    }
+    return hashes;
+}
+
+// Recompile the Tiled maps into the bundles the game loads, so they can't go stale.
+function buildMaps() {
+    execFileSync(process.env.PYTHON || 'python', ['tools/build_map.py'], { stdio: 'inherit' });
+    console.log('✅ Compiled Tiled maps -> assets/tilemap/*.tmb');
+}
 
 async function main() {
+    buildMaps();
     mkdirSync('./dist', { recursive: true });
     await zip('./src', './dist/src.zip');
     console.log('✅ Zipped src/ -> dist/src.zip');
+
+    const hashes = hashTree('assets', { 'dist/src.zip': hashFile('dist/src.zip') });
+    writeFileSync('./dist/asset-hashes.json', JSON.stringify(hashes, null, 2));
+    console.log(`✅ Hashed ${Object.keys(hashes).length} files -> dist/asset-hashes.json`);
 }
 
 main();
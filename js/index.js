@@ -1,5 +1,83 @@
+// Images drawn through the packed draw buffer, indexed by the ids assigned in src/view/draw_buffer.py
+const drawImages = [];
+
+function registerDrawImage(id, image) {
+    drawImages[id] = image;
+}
+
+// Replays `count` records of a Float32Array packed by DrawBuffer:
+// image id, source x/y/w/h, destination x/y/w/h, rotation (radians), opacity.
+const DRAW_RECORD_SIZE = 11;
+
+function executeDrawBuffer(ctx, buffer, count) {
+    // records come batched by image, only look the image up when the id changes
+    let imageId = -1;
+    let image = null;
+    for (let i = 0; i < count; i++) {
+        const o = i * DRAW_RECORD_SIZE;
+        if (buffer[o] !== imageId) {
+            imageId = buffer[o];
+            image = drawImages[imageId];
+        }
+        if (!image) continue;
+        const sw = buffer[o + 3];
+        const dx = buffer[o + 5];
+        const dy = buffer[o + 6];
+        const dw = buffer[o + 7];
+        const dh = buffer[o + 8];
+        const rotation = buffer[o + 9];
+        const opacity = buffer[o + 10];
+
+        if (rotation !== 0 || opacity !== 1) {
+            ctx.save();
+            ctx.globalAlpha = opacity;
+            ctx.translate(dx + dw / 2, dy + dh / 2);
+            ctx.rotate(rotation);
+            if (sw > 0) {
+                ctx.drawImage(image, buffer[o + 1], buffer[o + 2], sw, buffer[o + 4], -dw / 2, -dh / 2, dw, dh);
+            } else {
+                ctx.drawImage(image, -dw / 2, -dh / 2, dw, dh);
+            }
+            ctx.restore();
+        } else if (sw > 0) {
+            ctx.drawImage(image, buffer[o + 1], buffer[o + 2], sw, buffer[o + 4], dx, dy, dw, dh);
+        } else {
+            ctx.drawImage(image, dx, dy, dw, dh);
+        }
+    }
+}
+
+// Cache API storage shared with src/engine/assets.py, keyed by `<path>?v=<content hash>`
+const ASSET_CACHE_NAME = 'snazzy-snowdrops-assets';
+
+async function loadAssetHashes() {
+    // written by build-zip.js, revalidated on every load so new builds are picked up
+    const response = await fetch('dist/asset-hashes.json', { cache: 'no-cache' });
+    return response.ok ? response.json() : {};
+}
+
+// Fetch `url`, or reuse the cached response stored under the same content hash
+async function cachedFetch(url, hash) {
+    if (!hash || !('caches' in window)) {
+        return fetch(url);
+    }
+    const cache = await caches.open(ASSET_CACHE_NAME);
+    const key = `${url}?v=${hash}`;
+    const cached = await cache.match(key);
+    if (cached) {
+        return cached;
+    }
+    const response = await fetch(url);
+    if (response.ok) {
+        await cache.delete(url, { ignoreSearch: true });
+        await cache.put(key, response.clone());
+    }
+    return response;
+}
+
 async function loadProject(pyodide) {
-    const response = await fetch('../dist/src.zip'); // served from dist
+    const hashes = await loadAssetHashes();
+    const response = await cachedFetch('../dist/src.zip', hashes['dist/src.zip']); // served from dist
     let buffer = await response.arrayBuffer();
 
     await pyodide.unpackArchive(buffer, 'zip'); // by default, unpacks to the current dir
@@ -31,27 +109,41 @@ async function loadInventory() {
     document.querySelector('.inventory-overlay').innerHTML = htmlText;
 }
 
+// Startup phases, merged with the Python ones into window.startupReport by src/startup.py
+window.startupPhases = [];
+
+async function timePhase(name, phase) {
+    const start = performance.now();
+    try {
+        return await phase();
+    } finally {
+        window.startupPhases.push({ name, start_ms: start, duration_ms: performance.now() - start });
+    }
+}
+
 async function main() {
-    await loadMenu();
-    await loadDialog();
-    await loadInventory();
+    await timePhase('load html components', async () => {
+        await loadMenu();
+        await loadDialog();
+        await loadInventory();
+    });
     console.log('Loading Pyodide...');
-    const pyodide = await loadPyodide();
+    const pyodide = await timePhase('boot pyodide', () => loadPyodide());
 
     pyodide.setDebug(true);
 
-    console.log('Loading packages ...');
-    await pyodide.loadPackage('numpy');
-
     console.log('Loading python project...');
 
-    await loadProject(pyodide);
+    await timePhase('load project', () => loadProject(pyodide));
 
     console.log('Loading Python packages...');
     await pyodide.runPythonAsync(`
         import sys
         sys.path.append('/src')
-        import main
+        import startup
+        startup.profiler.install_import_timer()
+        with startup.profiler.phase("import main"):
+            import main
         await main.start()
     `);
 
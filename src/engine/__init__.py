@@ -1,19 +1,22 @@
 # reexport all components from the engine module
 from .camera import Camera
+from .clock import Clock, RealTimeClock, VirtualClock
 from .event_bus import EventBus
 from .game_engine import GameEngine
 from .input_system import InputSystem
 from .renderer_system import RenderSystem
 from .sound_system import SoundSystem
-from .state import DelayState, PauseState
+from .state import PauseState
 
 __all__ = [
     "Camera",
-    "DelayState",
+    "Clock",
     "EventBus",
     "GameEngine",
     "InputSystem",
     "PauseState",
+    "RealTimeClock",
     "RenderSystem",
     "SoundSystem",
+    "VirtualClock",
 ]
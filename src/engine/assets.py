@@ -0,0 +1,219 @@
+"""Concurrent loading of the files the game needs before its first frame."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+import js
+from js import URL, Audio, Blob, Image, Response, Uint8Array
+from pyodide.ffi import to_js
+from pyodide.http import pyfetch
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Iterable
+
+# Content hashes of the served files, written by build-zip.js
+ASSET_VERSIONS_PATH = "dist/asset-hashes.json"
+# Cache API storage shared with js/index.js, which keeps dist/src.zip there
+CACHE_NAME = "snazzy-snowdrops-assets"
+
+
+class AssetCache(ABC):
+    """Persistent storage of fetched files, by path and content version.
+
+    Only one version of a path is kept: storing a new one replaces the old.
+    """
+
+    @abstractmethod
+    async def get(self, path: str, version: str) -> bytes | None:
+        """Return the stored content of `path` at `version`, or None if it isn't stored."""
+
+    @abstractmethod
+    async def put(self, path: str, version: str, data: bytes) -> None:
+        """Store the content of `path` at `version`."""
+
+
+class MemoryAssetCache(AssetCache):
+    """Cache that lives as long as the Python process, for tests and headless runs."""
+
+    def __init__(self) -> None:
+        self._entries: dict[str, tuple[str, bytes]] = {}
+
+    async def get(self, path: str, version: str) -> bytes | None:
+        """Return the stored content of `path` at `version`, or None if it isn't stored."""
+        entry = self._entries.get(path)
+        return entry[1] if entry is not None and entry[0] == version else None
+
+    async def put(self, path: str, version: str, data: bytes) -> None:
+        """Store the content of `path` at `version`."""
+        self._entries[path] = (version, data)
+
+
+class BrowserAssetCache(AssetCache):
+    """Cache kept by the browser across page loads, through the Cache API.
+
+    Entries are keyed by `<path>?v=<version>`. Where the Cache API is unavailable,
+    e.g. outside secure contexts, nothing is stored.
+    """
+
+    def __init__(self, name: str = CACHE_NAME) -> None:
+        self.name = name
+        self._cache = None
+
+    async def _open(self) -> object | None:
+        if self._cache is None and hasattr(js, "caches"):
+            self._cache = await js.caches.open(self.name)
+        return self._cache
+
+    async def get(self, path: str, version: str) -> bytes | None:
+        """Return the stored content of `path` at `version`, or None if it isn't stored."""
+        cache = await self._open()
+        res = await cache.match(f"{path}?v={version}") if cache is not None else None
+        if res is None:
+            return None
+        return (await res.arrayBuffer()).to_bytes()
+
+    async def put(self, path: str, version: str, data: bytes) -> None:
+        """Store the content of `path` at `version`."""
+        cache = await self._open()
+        if cache is None:
+            return
+        await cache.delete(path, to_js({"ignoreSearch": True}, dict_converter=js.Object.fromEntries))
+        await cache.put(f"{path}?v={version}", Response.new(_to_uint8_array(data)))
+
+
+def _to_uint8_array(data: bytes) -> Uint8Array:
+    array = Uint8Array.new(len(data))
+    array.assign(data)
+    return array
+
+
+@dataclass(frozen=True, slots=True)
+class AssetManifest:
+    """Paths of the JSON files, images and binary files to load before the game starts."""
+
+    json: tuple[str, ...] = ()
+    images: tuple[str, ...] = ()
+    data: tuple[str, ...] = ()
+
+
+@dataclass(slots=True)
+class Assets:
+    """Loaded assets, by path."""
+
+    json: dict[str, dict] = field(default_factory=dict)
+    images: dict[str, Image] = field(default_factory=dict)
+    data: dict[str, bytes] = field(default_factory=dict)
+
+
+class AssetLoader:
+    """Fetches assets concurrently, each path once however often it is requested.
+
+    Images are awaited until decoded, so their first draw doesn't stall the frame.
+    `on_progress(loaded, total, path)` is called as each asset completes.
+
+    Files with a version in `versions` are read from `cache` when it holds that
+    version, and stored in it otherwise, so unchanged files skip the network on
+    the next start.
+    """
+
+    def __init__(
+        self,
+        on_progress: Callable[[int, int, str], None] | None = None,
+        cache: AssetCache | None = None,
+        versions: dict[str, str] | None = None,
+    ) -> None:
+        self.on_progress = on_progress
+        self.cache = cache
+        self.versions = versions or {}
+        self.loaded = 0
+        self.total = 0
+        self.cache_hits = 0
+        self._pending: dict[str, asyncio.Future] = {}
+        self._audio: dict[str, Audio] = {}
+
+    async def load(self, manifest: AssetManifest) -> Assets:
+        """Fetch and decode everything in `manifest` at once and return it by path."""
+        json_paths = list(dict.fromkeys(manifest.json))
+        image_paths = list(dict.fromkeys(manifest.images))
+        data_paths = list(dict.fromkeys(manifest.data))
+        results = await asyncio.gather(
+            *(self._once(path, self._load_json) for path in json_paths),
+            *(self._once(path, self._load_image) for path in image_paths),
+            *(self._once(path, self._read) for path in data_paths),
+        )
+        images_start = len(json_paths)
+        data_start = images_start + len(image_paths)
+        return Assets(
+            json=dict(zip(json_paths, results[:images_start], strict=True)),
+            images=dict(zip(image_paths, results[images_start:data_start], strict=True)),
+            data=dict(zip(data_paths, results[data_start:], strict=True)),
+        )
+
+    def preload_audio(self, paths: Iterable[str]) -> dict[str, Audio]:
+        """Start buffering audio files in the background, without waiting for them."""
+        for path in paths:
+            if path not in self._audio:
+                audio = Audio.new()
+                audio.preload = "auto"
+                audio.src = path
+                self._audio[path] = audio
+        return self._audio
+
+    def _once(self, path: str, load: Callable[[str], Awaitable[object]]) -> asyncio.Future:
+        if path not in self._pending:
+            self.total += 1
+            self._pending[path] = asyncio.ensure_future(self._track(path, load(path)))
+        return self._pending[path]
+
+    async def _track(self, path: str, loading: Awaitable[object]) -> object:
+        asset = await loading
+        self.loaded += 1
+        if self.on_progress:
+            self.on_progress(self.loaded, self.total, path)
+        return asset
+
+    def _is_cached(self, path: str) -> bool:
+        return self.cache is not None and path in self.versions
+
+    async def _read(self, path: str) -> bytes:
+        """Return the content of `path`, from the cache when it holds the current version."""
+        if not self._is_cached(path):
+            return await (await pyfetch(path)).bytes()
+        version = self.versions[path]
+        data = await self.cache.get(path, version)
+        if data is not None:
+            self.cache_hits += 1
+            return data
+        res = await pyfetch(path)
+        data = await res.bytes()
+        if res.ok:
+            await self.cache.put(path, version, data)
+        return data
+
+    async def _load_json(self, path: str) -> dict:
+        return json.loads(await self._read(path))
+
+    async def _load_image(self, path: str) -> Image:
+        image = Image.new()
+        if not self._is_cached(path):
+            image.src = path
+            await image.decode()
+            return image
+        url = URL.createObjectURL(Blob.new(to_js([_to_uint8_array(await self._read(path))])))
+        try:
+            image.src = url
+            await image.decode()
+        finally:
+            URL.revokeObjectURL(url)
+        return image
+
+
+async def load_asset_versions(path: str = ASSET_VERSIONS_PATH) -> dict[str, str]:
+    """Fetch the content hashes of the served files, or nothing without a build."""
+    res = await pyfetch(path, cache="no-cache")
+    return await res.json() if res.ok else {}
@@ -35,6 +35,15 @@ class Camera:
         wy = sy / self.zoom + self.y
         return wx, wy
 
+    def view_rect(self) -> tuple[float, float, float, float]:
+        """Return the world-space rectangle (x0, y0, x1, y1) visible on screen."""
+        return (
+            self.x,
+            self.y,
+            self.x + self.screen_w / self.zoom,
+            self.y + self.screen_h / self.zoom,
+        )
+
     def center_on(self, pos: Pos) -> None:
         """Center the camera on a given world position."""
         half_w_world = (self.screen_w / self.zoom) * 0.5
@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+
+from js import performance
+
+
+class Clock(ABC):
+    """Source of time for the game loop, in seconds.
+
+    Only `GameEngine.update` reads the clock, to decide how many fixed steps
+    are due; the systems receive the step's `dt` instead of reading the time.
+    """
+
+    @abstractmethod
+    def now(self) -> float:
+        """Return the current time in seconds."""
+
+
+class RealTimeClock(Clock):
+    """Wall-clock time from the browser's `performance.now()`."""
+
+    def now(self) -> float:
+        """Return the seconds elapsed since the page loaded."""
+        return performance.now() / 1000
+
+
+class VirtualClock(Clock):
+    """Time that only moves when advanced, for deterministic and fast-forwarded runs."""
+
+    def __init__(self, start: float = 0.0) -> None:
+        self._now = start
+
+    def now(self) -> float:
+        """Return the virtual time in seconds."""
+        return self._now
+
+    def advance(self, seconds: float) -> None:
+        """Move the virtual time forward."""
+        if seconds < 0:
+            msg = f"A clock can't go backwards, got {seconds}"
+            raise ValueError(msg)
+        self._now += seconds
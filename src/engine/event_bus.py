@@ -1,8 +1,13 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import heapq
+import itertools
+from collections import deque
+from dataclasses import dataclass, field
 from enum import Enum
 
+DEFAULT_QUEUE_CAPACITY = 1024
+
 
 class EventType(Enum):
     """Types of events that can be posted to the EventBus."""
@@ -28,6 +33,9 @@ class EventType(Enum):
     OPEN_SETTINGS = "open_settings"
     OPEN_HELP = "open_help"
 
+    # scheduled events
+    ZOMBIE_ATTACK = "zombie_attack"
+
     # inventory events
     INVENTORY_CHANGE = "inventory_change"
 
@@ -35,6 +43,16 @@ class EventType(Enum):
     PLACE_MODE_STATE_CHANGE = "place_mode_state_change"
 
 
+# Input events go stale: a move or click nobody consumed within this many ticks
+# (EventBus.clear calls), e.g. because it was made while the game is paused, is
+# dropped rather than replayed later. Other events are kept until consumed.
+EVENT_TTLS = {
+    EventType.MOUSE_CLICK: 30,
+    EventType.PLAYER_MOVED: 30,
+    EventType.PUZZLE_INPUT: 30,
+}
+
+
 @dataclass
 class GameEvent:
     """Represents a game-wide event."""
@@ -42,27 +60,168 @@ class GameEvent:
     event_type: EventType
     payload: dict
     is_consumed: bool = False
+    ttl: int | None = None  # in ticks, defaults to EVENT_TTLS, None keeps the event until it is consumed
+    age: int = field(default=0, repr=False, compare=False)
+    seq: int = field(default=0, repr=False, compare=False)  # post order, set by the EventBus
+
+    def __post_init__(self) -> None:
+        if self.ttl is None:
+            self.ttl = EVENT_TTLS.get(self.event_type)
 
     def consume(self) -> None:
         """Mark the event as consumed."""
         self.is_consumed = True
 
 
-class EventBus:
-    """A simple publish/subscribe queue."""
+@dataclass(order=True, slots=True)
+class ScheduledEvent:
+    """A timer created by `EventBus.schedule`, ordered by due time."""
+
+    due: float
+    seq: int
+    event_type: EventType = field(compare=False)
+    payload: dict = field(compare=False)
+    interval: float | None = field(default=None, compare=False)
+    cancelled: bool = field(default=False, compare=False)
+
+    def cancel(self) -> None:
+        """Stop the timer, it is discarded the next time it comes due."""
+        self.cancelled = True
+
+
+class OverflowPolicy(Enum):
+    """What `EventBus.post` does when the queue is full."""
 
-    def __init__(self) -> None:
-        self._queue: list[GameEvent] = []
+    DROP_OLDEST = "drop_oldest"
+    DROP_NEWEST = "drop_newest"
+    RAISE = "raise"
+
+
+class EventQueueFullError(RuntimeError):
+    """Raised by `EventBus.post` when the queue is full and the policy is `OverflowPolicy.RAISE`."""
+
+
+@dataclass(slots=True)
+class EventBusStats:
+    """Counters describing the EventBus queue over its lifetime."""
+
+    posted: int = 0
+    expired: int = 0
+    dropped: int = 0
+    peak_depth: int = 0
+
+
+class EventBus:
+    """A simple publish/subscribe queue.
+
+    Besides the queue of every posted event, events are indexed by type so that
+    consumers can subscribe to just the types they handle with
+    `get_events(EventType.X, ...)` instead of scanning all traffic.
+
+    Events can also be scheduled to be posted later, once or repeatedly. Timers
+    run on simulation time, which only moves when `advance` is called.
+    """
+
+    def __init__(
+        self,
+        capacity: int = DEFAULT_QUEUE_CAPACITY,
+        overflow_policy: OverflowPolicy = OverflowPolicy.DROP_OLDEST,
+    ) -> None:
+        self.capacity = capacity
+        self.overflow_policy = overflow_policy
+        self.stats = EventBusStats()
+        self._queue: deque[GameEvent] = deque()
+        self._by_type: dict[EventType, deque[GameEvent]] = {}
+        self._seq = 0
+        self.time = 0.0
+        self._timers: list[ScheduledEvent] = []
+        self._timer_seq = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self._queue)
 
     def post(self, evt: GameEvent) -> None:
-        """Post a new event to the queue."""
+        """Post a new event to the queue, applying the overflow policy if it is full."""
+        if len(self._queue) >= self.capacity:
+            if self.overflow_policy is OverflowPolicy.RAISE:
+                msg = f"EventBus queue is full ({self.capacity} events), cannot post {evt.event_type}"
+                raise EventQueueFullError(msg)
+            self.stats.dropped += 1
+            if self.overflow_policy is OverflowPolicy.DROP_NEWEST:
+                return
+            # the oldest event overall is also the oldest one of its type
+            oldest = self._queue.popleft()
+            self._by_type[oldest.event_type].popleft()
+
+        self._seq += 1
+        evt.seq = self._seq
         self._queue.append(evt)
-
-    def get_events(self) -> list[GameEvent]:
-        """Retrieve all events in the queue."""
-        return self._queue
+        self._by_type.setdefault(evt.event_type, deque()).append(evt)
+        self.stats.posted += 1
+        self.stats.peak_depth = max(self.stats.peak_depth, len(self._queue))
+
+    def schedule(
+        self,
+        event_type: EventType,
+        payload: dict | None = None,
+        delay: float = 0.0,
+        interval: float | None = None,
+    ) -> ScheduledEvent:
+        """Post an event `delay` seconds from now, then every `interval` seconds if given."""
+        if interval is not None and interval <= 0:
+            msg = f"Timer interval must be positive, got {interval}"
+            raise ValueError(msg)
+        timer = ScheduledEvent(
+            due=self.time + delay,
+            seq=next(self._timer_seq),
+            event_type=event_type,
+            payload=payload or {},
+            interval=interval,
+        )
+        heapq.heappush(self._timers, timer)
+        return timer
+
+    def advance(self, dt: float) -> None:
+        """Move simulation time forward by `dt` seconds and post the events that came due."""
+        self.time += dt
+        timers = self._timers
+        while timers and timers[0].due <= self.time:
+            timer = heapq.heappop(timers)
+            if timer.cancelled:
+                continue
+            self.post(GameEvent(event_type=timer.event_type, payload=dict(timer.payload)))
+            if timer.interval is not None:
+                timer.due += timer.interval
+                heapq.heappush(timers, timer)
+
+    def get_events(self, *event_types: EventType) -> list[GameEvent]:
+        """Retrieve the events in the queue, only those of `event_types` if any are given.
+
+        Events are returned in the order they were posted.
+        """
+        if not event_types:
+            return list(self._queue)
+        queues = [self._by_type[t] for t in event_types if self._by_type.get(t)]
+        if len(queues) <= 1:
+            return list(queues[0]) if queues else []
+        return list(heapq.merge(*queues, key=lambda evt: evt.seq))
 
     def clear(self, force: bool = False) -> None:
-        """Clear the event queue."""
-        # only clear events that are consumed
-        self._queue = [evt for evt in self._queue if not evt.is_consumed or force]
+        """Drop consumed and expired events, or every event if `force` is set.
+
+        Called once per tick, so it also ages the events that are kept.
+        """
+        queue = self._queue
+        self._queue = deque()
+        self._by_type = {}
+        if force:
+            return
+        for evt in queue:
+            if evt.is_consumed:
+                continue
+            evt.age += 1
+            if evt.ttl is not None and evt.age >= evt.ttl:
+                self.stats.expired += 1
+                continue
+            self._queue.append(evt)
+            self._by_type.setdefault(evt.event_type, deque()).append(evt)
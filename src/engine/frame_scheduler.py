@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from js import window
+
+from engine.proxies import ProxyManager, proxy_manager
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+class FrameScheduler:
+    """Calls `callback(timestamp)` on every animation frame until stopped.
+
+    One proxy is created up front and re-registered with `requestAnimationFrame`
+    each frame, instead of wrapping a new callback every frame.
+    """
+
+    def __init__(self, callback: Callable[[float], None], proxies: ProxyManager = proxy_manager) -> None:
+        self._callback = callback
+        self._proxies = proxies
+        self._proxy = proxies.create(self._on_frame)
+        self._handle: int | None = None
+        self.running = False
+
+    def start(self) -> None:
+        """Schedule the callback on the next frame."""
+        if self.running:
+            return
+        self.running = True
+        self._handle = window.requestAnimationFrame(self._proxy)
+
+    def stop(self) -> None:
+        """Cancel the pending frame, the scheduler can be started again."""
+        self.running = False
+        if self._handle is not None:
+            window.cancelAnimationFrame(self._handle)
+            self._handle = None
+
+    def destroy(self) -> None:
+        """Stop and release the frame proxy."""
+        self.stop()
+        self._proxies.destroy(self._proxy)
+
+    def _on_frame(self, timestamp: float) -> None:
+        self._handle = None
+        if not self.running:
+            return
+        self._callback(timestamp)
+        if self.running:
+            self._handle = window.requestAnimationFrame(self._proxy)
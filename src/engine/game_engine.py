@@ -3,13 +3,20 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from js import Event, document
-from pyodide.ffi import create_proxy
 
+from engine.clock import Clock, RealTimeClock
 from engine.event_bus import EventType, GameEvent
 from engine.input_system import InputType
+from engine.proxies import proxy_manager
+from ui import DialogBox
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from pyodide.ffi import JsProxy
+
     from engine.event_bus import EventBus
+    from engine.frame_scheduler import FrameScheduler
     from engine.input_system import InputSystem
     from engine.place import PlaceSystem
     from engine.renderer_system import RenderSystem
@@ -18,6 +25,11 @@ if TYPE_CHECKING:
     from game.entities.entity import Entity
     from game.world import World
 
+# Length of a simulation step, in seconds
+FIXED_DT = 1 / 60
+# Most simulation steps run per frame, the remaining backlog is dropped (spiral-of-death guard)
+MAX_STEPS_PER_FRAME = 5
+
 
 class GameEngine:
     """Main game controller tying together world, renderer, input, and events."""
@@ -31,6 +43,7 @@ class GameEngine:
         sound_sys: SoundSystem,
         settings: Settings,
         place_sys: PlaceSystem,
+        clock: Clock | None = None,
     ) -> None:
         self.world = world
         self.renderer = renderer
@@ -40,10 +53,76 @@ class GameEngine:
         self.settings = settings
         self.place_sys = place_sys
         self.puzzle_started = False
-
-        self._play_bgm_on_load_proxy = create_proxy(self._play_bgm_on_load)
-        document.addEventListener("click", self._play_bgm_on_load_proxy)
-        document.addEventListener("keypress", self._play_bgm_on_load_proxy)
+        self.clock = clock or RealTimeClock()
+        self.play_time = 0.0  # seconds spent in the resumed game since the last new game
+        self.dt = FIXED_DT
+        self.alpha = 0.0  # progress from the last simulation step toward the next one, for rendering
+        self._accumulator = 0.0
+        self._last_time: float | None = None
+        self.frame_scheduler: FrameScheduler | None = None
+        self._listeners: list[tuple[object, str, JsProxy]] = []
+        self._proxies: list[JsProxy] = []
+        self.world.schedule_timers(event_bus)
+
+        self._play_bgm_on_load_proxy = self.add_listener(document, ("click", "keypress"), self._play_bgm_on_load)
+
+    def add_listener(self, target: object, event_names: tuple[str, ...], callback: Callable) -> JsProxy:
+        """Listen to DOM events on `target` through one managed proxy, released on `teardown`."""
+        proxy = proxy_manager.create(callback)
+        self._proxies.append(proxy)
+        for event_name in event_names:
+            target.addEventListener(event_name, proxy)
+            self._listeners.append((target, event_name, proxy))
+        return proxy
+
+    def remove_listeners(self, proxy: JsProxy) -> None:
+        """Stop listening with `proxy`, the proxy itself is released on `teardown`."""
+        remaining = []
+        for target, event_name, listener in self._listeners:
+            if listener is proxy:
+                target.removeEventListener(event_name, listener)
+            else:
+                remaining.append((target, event_name, listener))
+        self._listeners = remaining
+
+    def teardown(self) -> None:
+        """Stop the game loop and release every browser callback the engine registered."""
+        if self.frame_scheduler:
+            self.frame_scheduler.destroy()
+            self.frame_scheduler = None
+        for target, event_name, listener in self._listeners:
+            target.removeEventListener(event_name, listener)
+        self._listeners = []
+        for proxy in self._proxies:
+            proxy_manager.destroy(proxy)
+        self._proxies = []
+        self.renderer.view_bridge.teardown()
+        DialogBox.unbind_buttons()
+
+    def update(self) -> int:
+        """Run the fixed simulation steps that are due by the clock and return how many ran.
+
+        Real elapsed time is accumulated and consumed in steps of `dt`, so the
+        simulation speed does not depend on the display refresh rate.
+        """
+        now = self.clock.now()
+        if self._last_time is None:
+            self._last_time = now
+        self._accumulator += now - self._last_time
+        self._last_time = now
+
+        steps = 0
+        while self._accumulator >= self.dt and steps < MAX_STEPS_PER_FRAME:
+            self.tick(self.dt)
+            self.event_bus.clear()
+            self._accumulator -= self.dt
+            steps += 1
+        if steps == MAX_STEPS_PER_FRAME:
+            # too far behind, e.g. after the tab was in the background
+            self._accumulator %= self.dt
+
+        self.alpha = self._accumulator / self.dt
+        return steps
 
     def tick(self, dt: float) -> None:
         """Advance the game state by dt seconds."""
@@ -87,6 +166,8 @@ class GameEngine:
             # handle keyboard events
             elif input_event.input_type in (InputType.KEYDOWN, InputType.KEYUP):
                 event_type = self.get_event_type(input_event.key)
+                if event_type is None:
+                    continue
 
                 self.event_bus.post(
                     GameEvent(
@@ -95,19 +176,25 @@ class GameEngine:
                     ),
                 )
 
+        if self.event_bus.get_events(EventType.NEW_GAME):
+            self.play_time = 0.0
+
         self.settings.update(self.event_bus)
         if self.settings.game_state.is_resumed():
+            self.play_time += dt
+            self.event_bus.advance(dt)
             self.place_sys.update()
             self.world.update(dt, self.event_bus)
 
-    def render(self, now: float) -> None:
+    def render(self) -> None:
         """Render the current game state."""
-        self.renderer.update(now, self.event_bus, self.world)
+        self.renderer.update(self.play_time, self.event_bus, self.world, self.settings.game_state)
         if self.settings.game_state.is_paused():
             return
         cmds = self.renderer.build_draw_queue(
             self.world,
             self.renderer.camera,
+            self.alpha,
         )
         self.renderer.flush_to_view(cmds)
 
@@ -132,6 +219,4 @@ class GameEngine:
     def _play_bgm_on_load(self, event: Event) -> None:
         if event.isTrusted:
             self.sound_sys.play_bgm("normal")
-
-            document.removeEventListener("click", self._play_bgm_on_load_proxy)
-            document.removeEventListener("keypress", self._play_bgm_on_load_proxy)
+            self.remove_listeners(self._play_bgm_on_load_proxy)
@@ -25,7 +25,7 @@ class PlaceSystem:
 
     def update(self) -> None:
         """Update Place Mode and throw stuff if clicks are recieved."""
-        events = self.event_bus.get_events()
+        events = self.event_bus.get_events(EventType.PLACE_MODE_STATE_CHANGE, EventType.MOUSE_CLICK)
 
         for event in events:
             if event.event_type == EventType.PLACE_MODE_STATE_CHANGE:
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from js import window
+from pyodide.ffi import create_proxy
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from pyodide.ffi import JsProxy
+
+
+class ProxyManager:
+    """Owns the JS proxies wrapping Python callbacks handed to the browser.
+
+    Proxies are not garbage collected, so callbacks should be wrapped once and
+    kept for as long as they are needed. `live_count` makes leaks visible, and is
+    mirrored in `window.liveProxyCount` for the browser's devtools.
+    """
+
+    def __init__(self) -> None:
+        self._proxies: dict[int, JsProxy] = {}
+        self._publish()
+
+    @property
+    def live_count(self) -> int:
+        """Number of proxies created and not yet destroyed."""
+        return len(self._proxies)
+
+    def create(self, callback: Callable) -> JsProxy:
+        """Wrap `callback` in a long-lived proxy."""
+        proxy = create_proxy(callback)
+        self._proxies[id(proxy)] = proxy
+        self._publish()
+        return proxy
+
+    def destroy(self, proxy: JsProxy) -> None:
+        """Release `proxy`, it must not be called by JS afterwards."""
+        if self._proxies.pop(id(proxy), None) is not None:
+            proxy.destroy()
+            self._publish()
+
+    def _publish(self) -> None:
+        window.liveProxyCount = self.live_count
+
+
+# shared by the systems that register browser callbacks
+proxy_manager = ProxyManager()
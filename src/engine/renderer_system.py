@@ -3,16 +3,26 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from engine.event_bus import EventType, GameEvent
-from engine.state import GameState
-from models.draw_cmd import DrawCmd, DrawCmdType
-from models.position import Pos
-from puzzles import puzzles, SlidingTilesPuzzle
+from models.draw_cmd import DrawCmd, DrawCmdPool, DrawCmdType, LayerBuckets
+from puzzles import PuzzleLoader
 from ui import DialogBox, InventoryOverlay, InventoryState, StatusBar
 
+# Sprites are anchored at their top-left corner, so the entity query reaches this many
+# tiles above and left of the view to find sprites overlapping its edges
+SPRITE_CULL_MARGIN_TILES = 4
+# Outline the collision boxes, a debugging aid: they are invisible in the game
+DRAW_COLLISION_BOXES = False
+
 if TYPE_CHECKING:
+    from collections.abc import Hashable
+
     from engine.camera import Camera
     from engine.event_bus import EventBus
+    from engine.state import GameState
     from game.world import World
+    from models.draw_cmd import BatchStats
+    from models.tile import TileMap
+    from puzzles.sliding_tiles_puzzle import SlidingTilesPuzzle
     from view.view_bridge import ViewBridge
 
 
@@ -31,15 +41,28 @@ class RenderSystem:
         self.status_bar = StatusBar()
         self.inventory_overlay: InventoryOverlay = inventory_overlay
         self.active_puzzle: SlidingTilesPuzzle | None = None
+        # puzzles and NumPy are loaded on demand, the puzzle opens once they are
+        self.puzzle_loader = PuzzleLoader()
+        self._pending_puzzle: str | None = None
+        # draw commands are recycled between frames, see DrawCmdPool
+        self._cmd_pool = DrawCmdPool()
+        self._layers = LayerBuckets()
+        self._textures: dict[Hashable, int] = {}
+        self._tile_textures: dict[int, int] = {}
 
     def build_draw_queue(
         self,
         world: World,
         camera: Camera,
+        alpha: float = 1.0,
     ) -> list[DrawCmd]:
-        """Generate a list of draw commands based on the current world state."""
-        draw_commands = []
-        draw_commands.extend(self._build_world_draw_commands(world, camera))
+        """Generate a list of draw commands based on the current world state.
+
+        Entities are drawn `alpha` of the way between their previous and current simulation positions.
+        The returned commands are only valid until the next call.
+        """
+        self._cmd_pool.reset()
+        draw_commands = self._build_world_draw_commands(world, camera, alpha)
         draw_commands.extend(
             self._build_ui_draw_commands(
                 world,
@@ -52,39 +75,44 @@ class RenderSystem:
         world: World,
     ) -> list[DrawCmd]:
         draw_commands = []
+        center_x = world.tile_map.width * world.tile_map.tile_size / 2
+        center_y = world.tile_map.height * world.tile_map.tile_size / 2
         if self.active_dialog:
-            dialog_position = Pos(
-                world.tile_map.width * world.tile_map.tile_size / 2,
-                world.tile_map.height * world.tile_map.tile_size / 2,
-                0,
-            )
             draw_commands.append(
-                DrawCmd(
-                    type=DrawCmdType.DIALOG,
+                self._cmd_pool.acquire(
+                    DrawCmdType.DIALOG,
+                    center_x,
+                    center_y,
                     dialog=self.active_dialog,
-                    position=dialog_position,
                     scale=self.camera.zoom,
                 ),
             )
 
         draw_commands.append(
-            DrawCmd(
-                type=DrawCmdType.INVENTORY_OVERLAY,
-                position=None,  # Position is handled by the InventoryOverlay class
+            # Position is handled by the InventoryOverlay class
+            self._cmd_pool.acquire(
+                DrawCmdType.INVENTORY_OVERLAY,
+                0,
+                0,
                 inventory_overlay=self.inventory_overlay,
             ),
         )
         if self.active_puzzle:
-            dialog_position = Pos(
-                world.tile_map.width * world.tile_map.tile_size / 2,
-                world.tile_map.height * world.tile_map.tile_size / 2,
-                0,
-            )
             draw_commands.append(
-                DrawCmd(
-                    type=DrawCmdType.PUZZLE,
+                self._cmd_pool.acquire(
+                    DrawCmdType.PUZZLE,
+                    center_x,
+                    center_y,
                     puzzle=self.active_puzzle,
-                    position=dialog_position,
+                ),
+            )
+        elif self._pending_puzzle and self.puzzle_loader.is_loading:
+            draw_commands.append(
+                self._cmd_pool.acquire(
+                    DrawCmdType.TEXT,
+                    self.camera.screen_w / 2,
+                    self.camera.screen_h / 2,
+                    text="Loading puzzle...",
                 ),
             )
 
@@ -94,101 +122,186 @@ class RenderSystem:
         self,
         world: World,
         camera: Camera,
+        alpha: float = 1.0,
     ) -> list[DrawCmd]:
         """Generate a list of draw commands based on the current world state."""
-        draw_commands = []
+        layers = self._layers
+        cmd_pool = self._cmd_pool
 
         # 1. Draw tiles from the tile map
         tile_map = world.tile_map
         tile_size_pixels = tile_map.tile_size  # pixels
 
-        start_tile_x = max(int(camera.x // tile_size_pixels), 0)
-        start_tile_y = max(int(camera.y // tile_size_pixels), 0)
+        view_x0, view_y0, view_x1, view_y1 = camera.view_rect()
+        start_tile_x = max(int(view_x0 // tile_size_pixels), 0)
+        start_tile_y = max(int(view_y0 // tile_size_pixels), 0)
 
-        end_tile_x = min(
-            int((camera.x + camera.screen_w / camera.zoom) // tile_size_pixels),
-            tile_map.width,
-        )
-        end_tile_y = min(
-            int((camera.y + camera.screen_h / camera.zoom) // tile_size_pixels),
-            tile_map.height,
-        )
+        end_tile_x = min(int(view_x1 // tile_size_pixels), tile_map.width - 1)
+        end_tile_y = min(int(view_y1 // tile_size_pixels), tile_map.height - 1)
 
-        for y in range(start_tile_y, end_tile_y + 1):
-            for x in range(start_tile_x, end_tile_x + 1):
-                tiles = tile_map.get(x, y)
-                if tiles:
-                    for tile in tiles:
-                        world_x = x * tile_size_pixels
-                        world_y = y * tile_size_pixels
-
-                        screen_x, screen_y = camera.world_to_screen(world_x, world_y)
-
-                        draw_commands.append(
-                            DrawCmd(
-                                type=DrawCmdType.TILE,
-                                tile_gid=tile.gid,
-                                position=Pos(screen_x, screen_y, tile.z),
-                                layer=tile.z,
-                                scale=self.camera.zoom,
-                            ),
-                        )
+        tile_bounds = (start_tile_x, start_tile_y, end_tile_x, end_tile_y)
+        if self.view_bridge.chunk_cache is not None:
+            # static terrain is pre-rendered in chunks, see view.chunk_cache
+            self._build_chunk_draw_commands(camera, tile_bounds)
+        else:
+            self._build_tile_draw_commands(tile_map, camera, tile_bounds)
 
         # 2. Draw collision boxes
-        for box in tile_map.collision_boxes:
-            if camera.x <= box.x < camera.x + camera.screen_w and camera.y <= box.y < camera.y + camera.screen_h:
-                screen_x, screen_y = camera.world_to_screen(box.x, box.y)
-                draw_commands.append(
-                    DrawCmd(
-                        type=DrawCmdType.COLLISION,
-                        position=Pos(screen_x, screen_y, 0),
-                        collision_box=box,
-                        scale=self.camera.zoom,
-                    ),
-                )
+        boxes = tile_map.collision_boxes_in_rect(view_x0, view_y0, view_x1, view_y1) if DRAW_COLLISION_BOXES else ()
+        for box in boxes:
+            screen_x, screen_y = camera.world_to_screen(box.x, box.y)
+            layers.add(
+                cmd_pool.acquire(
+                    DrawCmdType.COLLISION,
+                    screen_x,
+                    screen_y,
+                    collision_box=box,
+                    scale=self.camera.zoom,
+                ),
+            )
 
-        # 3. Draw entities (players, NPCs, items, etc.)
-        for entity in world.entities:
+        # 3. Draw entities (players, NPCs, items, etc.) whose sprite overlaps the view
+        margin = SPRITE_CULL_MARGIN_TILES * tile_size_pixels
+        for entity in world.find_in_rect(view_x0 - margin, view_y0 - margin, view_x1, view_y1):
             # Get sprite for this entity type
             sprite = entity.sprite_registry.get(entity.state.value) if hasattr(entity, "sprite_registry") else None
             if not sprite:
                 print(f"Sprite not found for entity: {entity} {entity.state}")
                 continue
 
-            world_pos_x, world_pos_y = entity.pos.x, entity.pos.y
+            prev_pos = entity.prev_pos
+            world_pos_x = prev_pos.x + (entity.pos.x - prev_pos.x) * alpha
+            world_pos_y = prev_pos.y + (entity.pos.y - prev_pos.y) * alpha
+            sprite_w, sprite_h = sprite.size
             if (
-                camera.x <= world_pos_x < camera.x + camera.screen_w
-                and camera.y <= world_pos_y < camera.y + camera.screen_h
+                world_pos_x < view_x1
+                and world_pos_x + sprite_w > view_x0
+                and world_pos_y < view_y1
+                and world_pos_y + sprite_h > view_y0
             ):
                 screen_x, screen_y = camera.world_to_screen(
                     world_pos_x,
                     world_pos_y,
                 )
 
-                draw_commands.append(
-                    DrawCmd(
-                        type=DrawCmdType.SPRITE,
+                layers.add(
+                    cmd_pool.acquire(
+                        DrawCmdType.SPRITE,
+                        screen_x,
+                        screen_y,
+                        entity.pos.z,
                         sprite=sprite,
-                        position=Pos(screen_x, screen_y, entity.pos.z),
+                        texture=self._texture_id(("sprite", sprite.image_path)),
                         layer=entity.pos.z,
+                        sublayer=tile_map.layers,  # above every tile layer of the same z
                         scale=self.camera.zoom,
                         frame_idx=(entity.frame_idx if hasattr(entity, "frame_idx") else 0),
                     ),
                 )
 
-        # Sort by layer for proper rendering order (lower layers first)
-        draw_commands.sort(key=lambda cmd: cmd.layer)
-
+        # Lower layers first, tile layers in map order, then batched by image
+        draw_commands = []
+        layers.drain_into(draw_commands)
         return draw_commands
 
+    def _build_tile_draw_commands(
+        self,
+        tile_map: TileMap,
+        camera: Camera,
+        tile_bounds: tuple[int, int, int, int],
+    ) -> None:
+        """Emit one draw command per visible tile per layer."""
+        start_tile_x, start_tile_y, end_tile_x, end_tile_y = tile_bounds
+        tile_size_pixels = tile_map.tile_size
+
+        gids = tile_map.gids
+        for layer in range(tile_map.layers):
+            z = tile_map.layer_z[layer]
+            for y in range(start_tile_y, end_tile_y + 1):
+                row_start = tile_map.index(layer, start_tile_x, y)
+                row = gids[row_start : row_start + end_tile_x - start_tile_x + 1]
+                for offset, gid in enumerate(row):
+                    if not gid:
+                        continue
+                    world_x = (start_tile_x + offset) * tile_size_pixels
+                    world_y = y * tile_size_pixels
+
+                    screen_x, screen_y = camera.world_to_screen(world_x, world_y)
+
+                    self._layers.add(
+                        self._cmd_pool.acquire(
+                            DrawCmdType.TILE,
+                            screen_x,
+                            screen_y,
+                            z,
+                            tile_gid=gid,
+                            texture=self._tile_texture_id(gid),
+                            layer=z,
+                            sublayer=layer,
+                            scale=self.camera.zoom,
+                        ),
+                    )
+
+    def _build_chunk_draw_commands(
+        self,
+        camera: Camera,
+        tile_bounds: tuple[int, int, int, int],
+    ) -> None:
+        """Emit one draw command per visible pre-rendered chunk of the tile layers."""
+        start_tile_x, start_tile_y, end_tile_x, end_tile_y = tile_bounds
+        chunk_cache = self.view_bridge.chunk_cache
+        chunk_tiles = chunk_cache.chunk_tiles
+
+        for chunk_y in range(start_tile_y // chunk_tiles, end_tile_y // chunk_tiles + 1):
+            for chunk_x in range(start_tile_x // chunk_tiles, end_tile_x // chunk_tiles + 1):
+                screen_x, screen_y = camera.world_to_screen(
+                    chunk_x * chunk_cache.chunk_size,
+                    chunk_y * chunk_cache.chunk_size,
+                )
+                self._layers.add(
+                    self._cmd_pool.acquire(
+                        DrawCmdType.CHUNK,
+                        screen_x,
+                        screen_y,
+                        chunk=(chunk_x, chunk_y),
+                        texture=self._texture_id(("chunk", chunk_x, chunk_y)),
+                        scale=self.camera.zoom,
+                    ),
+                )
+
+    @property
+    def batch_stats(self) -> BatchStats:
+        """Number of world draws and image batches in the last frame."""
+        return self._layers.stats
+
+    def _texture_id(self, key: Hashable) -> int:
+        """Return the batching id of the source image identified by `key`."""
+        texture = self._textures.get(key)
+        if texture is None:
+            texture = self._textures[key] = len(self._textures)
+        return texture
+
+    def _tile_texture_id(self, gid: int) -> int:
+        """Return the batching id of the tileset image a tile is cut from."""
+        texture = self._tile_textures.get(gid)
+        if texture is None:
+            rect = self.view_bridge.tiles_registry.get_rect(gid)
+            texture = self._tile_textures[gid] = self._texture_id(("tileset", id(rect[0]) if rect else None))
+        return texture
+
     def flush_to_view(self, cmds: list[DrawCmd]) -> None:
         """Send the draw commands to the view for rendering."""
         self.view_bridge.draw(cmds)
 
-    def update(self, now: float, event_bus: EventBus, world: World) -> None:
+    def update(self, play_time: float, event_bus: EventBus, world: World, game_state: GameState) -> None:
         """Update the renderer state, e.g., handle UI overlays."""
         # Handle any events related to rendering, e.g., UI updates
-        events = event_bus.get_events()
+        events = event_bus.get_events(
+            EventType.ASK_DIALOG,
+            EventType.CLOSE_DIALOG,
+            EventType.BEGIN_PUZZLE,
+            EventType.PUZZLE_INPUT,
+        )
         for event in events:
             if event.event_type == EventType.ASK_DIALOG:
                 self._handle_ask_dialog_event(event)
@@ -202,6 +315,7 @@ class RenderSystem:
                 self._handle_begin_puzzle_event(event)
             elif event.event_type == EventType.PUZZLE_INPUT:
                 self._handle_puzzle_input_event(event)
+        self._open_pending_puzzle()
         # update ui components like status bar
         if self.status_bar:
             player = world.get_current_player()
@@ -209,8 +323,8 @@ class RenderSystem:
                 hp=player.hp,
                 intelligence=player.intelligence,
                 fatigue=player.fatigue,
-                ticks=now,
-                events=events,
+                play_time=play_time,
+                hide=game_state.is_paused(),
             )
 
             self.status_bar.update_ui()
@@ -240,10 +354,23 @@ class RenderSystem:
         event.consume()
 
     def _handle_begin_puzzle_event(self, event: GameEvent) -> None:
-        self.active_puzzle = puzzles[event.payload["puzzle_kind"]]("assets/images/puzzle/image.png", 3, 50)
-        self.active_puzzle.shuffle()
+        self._pending_puzzle = event.payload["puzzle_kind"]
+        self.puzzle_loader.start()
         event.consume()
 
+    def _open_pending_puzzle(self) -> None:
+        """Open the requested puzzle once its module is loaded."""
+        if not self._pending_puzzle:
+            return
+        puzzle_class = self.puzzle_loader.get(self._pending_puzzle)
+        if puzzle_class is not None:
+            self.active_puzzle = puzzle_class("assets/images/puzzle/image.png", 3, 50)
+            self.active_puzzle.shuffle()
+            self._pending_puzzle = None
+        elif self.puzzle_loader.failed:
+            print(f"Puzzle {self._pending_puzzle} failed to load")
+            self._pending_puzzle = None
+
     def _handle_puzzle_input_event(self, event: GameEvent) -> None:
         if self.active_puzzle:
             key = event.payload.get("key")
@@ -16,7 +16,13 @@ class Settings:
 
     def update(self, event_bus: EventBus) -> None:
         """Update the settings based on game events."""
-        for event in event_bus.get_events():
+        for event in event_bus.get_events(
+            EventType.GAME_PAUSED,
+            EventType.GAME_RESUMED,
+            EventType.NEW_GAME,
+            EventType.OPEN_SETTINGS,
+            EventType.OPEN_HELP,
+        ):
             if event.event_type == EventType.GAME_PAUSED:
                 self.game_state = GameState.PAUSED
                 self.main_menu.make_visible()
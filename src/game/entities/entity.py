@@ -1,4 +1,6 @@
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import ClassVar
 
 from engine.interfaces import Behaviour, Object
 from models.position import Pos
@@ -8,6 +10,9 @@ from models.sprite import SpriteRegistry
 class Entity(Object, ABC):
     """Base class for all game entities."""
 
+    # Mutable attributes, besides position and animation frame, captured by `snapshot`
+    SNAPSHOT_FIELDS: ClassVar[tuple[str, ...]] = ()
+
     def __init__(
         self,
         entity_id: str,
@@ -18,6 +23,8 @@ class Entity(Object, ABC):
         """Initialize the entity with an ID and position."""
         self.id = entity_id
         self.pos = pos
+        # position at the previous simulation step, the renderer interpolates from it
+        self.prev_pos = Pos(pos.x, pos.y, pos.z)
         self.behaviour = behaviour
         self.sprite_registry = sprite_registry
         self.frame_idx = 0
@@ -28,3 +35,55 @@ class Entity(Object, ABC):
 
     def destroy(self) -> None:
         """Destroy the entity."""
+
+    def store_previous_position(self) -> None:
+        """Remember the current position before a simulation step moves the entity."""
+        self.prev_pos.x = self.pos.x
+        self.prev_pos.y = self.pos.y
+        self.prev_pos.z = self.pos.z
+
+    def interpolated_pos(self, alpha: float) -> Pos:
+        """Return the position `alpha` of the way from the previous simulation step to the current one."""
+        prev = self.prev_pos
+        return Pos(
+            prev.x + (self.pos.x - prev.x) * alpha,
+            prev.y + (self.pos.y - prev.y) * alpha,
+            self.pos.z,
+        )
+
+    def snapshot(self) -> "EntitySnapshot":
+        """Capture the mutable state of this entity."""
+        return EntitySnapshot(
+            entity=self,
+            x=self.pos.x,
+            y=self.pos.y,
+            z=self.pos.z,
+            frame_idx=self.frame_idx,
+            values=tuple(getattr(self, name) for name in self.SNAPSHOT_FIELDS),
+        )
+
+    def restore(self, snapshot: "EntitySnapshot") -> None:
+        """Restore the state captured by `snapshot` in place."""
+        self.pos.x = snapshot.x
+        self.pos.y = snapshot.y
+        self.pos.z = snapshot.z
+        self.store_previous_position()
+        self.frame_idx = snapshot.frame_idx
+        for name, value in zip(self.SNAPSHOT_FIELDS, snapshot.values, strict=True):
+            setattr(self, name, value)
+
+
+@dataclass(slots=True)
+class EntitySnapshot:
+    """Compact record of the mutable state of one entity."""
+
+    entity: Entity
+    x: float
+    y: float
+    z: int
+    frame_idx: int
+    values: tuple
+
+    def restore(self) -> None:
+        """Put the entity back into the captured state."""
+        self.entity.restore(self)
@@ -21,6 +21,8 @@ class FruitState(Enum):
 class Fruit(Entity, Interactable):
     """Represents a fruit entity in the game world."""
 
+    SNAPSHOT_FIELDS = ("state",)
+
     def __init__(
         self,
         fruit_id: str,
@@ -91,7 +93,8 @@ class Fruit(Entity, Interactable):
         **kwargs: int,
     ) -> None:
         """Update the fruit's state."""
-        events = kwargs.get("events", [])
+        event_bus = kwargs.get("event_bus")
+        events = event_bus.get_events(EventType.FRUIT_PICKED) if event_bus else []
         for event in events:
             if event.event_type == EventType.FRUIT_PICKED:
                 fruit_id = event.payload.get("fruit_id")
@@ -7,6 +7,8 @@ from game.entities.entity import Entity
 class NPC(Entity, Living):
     """Non-Player Character (NPC) in the game world."""
 
+    SNAPSHOT_FIELDS = ("hp", "ai_state")
+
     def __init__(
         self,
         entity_id: str,
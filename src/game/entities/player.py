@@ -10,6 +10,7 @@ from game.inventory import Inventory
 from models.direction import Direction
 
 if TYPE_CHECKING:
+    from game.inventory import Item
     from game.world import World
     from models.position import Pos
     from models.sprite import SpriteRegistry
@@ -33,6 +34,8 @@ class PlayerState(Enum):
 class Player(Entity, Living, Interactable):
     """Player character in the game world."""
 
+    SNAPSHOT_FIELDS = ("hp", "intelligence", "fatigue", "state", "_prev_state", "inventory_items")
+
     def __init__(
         self,
         entity_id: str,
@@ -56,6 +59,15 @@ class Player(Entity, Living, Interactable):
         self.state = PlayerState.IDLE_RIGHT
         self._prev_state = PlayerState.IDLE_RIGHT  # Previous state for animation purposes
 
+    @property
+    def inventory_items(self) -> dict[str, Item]:
+        """Copy of the inventory's items by id, as captured by `snapshot`."""
+        return self.inventory.return_all_items()
+
+    @inventory_items.setter
+    def inventory_items(self, items: dict[str, Item]) -> None:
+        self.inventory.slots = dict(items)
+
     def get_new_state_from_prev_state(self) -> PlayerState:
         """Get the new state based on the previous state."""
         if self._prev_state == PlayerState.WALKING_LEFT:
@@ -98,7 +110,8 @@ class Player(Entity, Living, Interactable):
     ) -> None:
         """Update the player's state."""
         # Player-specific update logic can go here
-        events = kwargs.get("events", [])
+        event_bus = kwargs.get("event_bus")
+        events = event_bus.get_events(EventType.PLAYER_MOVED) if event_bus else []
         curr_state = self.state
         self.state = self.get_new_state_from_prev_state()
         for event in events:
@@ -1,5 +1,4 @@
 import random
-import time
 from enum import Enum
 from typing import TYPE_CHECKING
 
@@ -22,6 +21,17 @@ class ZombieState(Enum):
         """Return a random walking state."""
         return random.choice(list(cls))
 
+    @classmethod
+    def from_direction(cls, dx: int, dy: int) -> "ZombieState":
+        """Return the walking state facing the given movement."""
+        if dx > 0:
+            return cls.WALKING_RIGHT
+        if dx < 0:
+            return cls.WALKING_LEFT
+        if dy < 0:
+            return cls.WALKING_UP
+        return cls.WALKING_DOWN
+
     def direction(self) -> Direction:
         """Return the direction associated with this state."""
         if self == ZombieState.WALKING_UP:
@@ -36,7 +46,7 @@ class ZombieState(Enum):
 
 
 class Zombie(Entity):
-    now = time.time()
+    SNAPSHOT_FIELDS = ("hp", "state", "prev_state", "chasing")
 
     def __init__(
         self,
@@ -51,21 +61,10 @@ class Zombie(Entity):
         self.step_size = 1
         self.chasing = True
         self.prev_state = ZombieState.WALKING_DOWN
-        self.take_damage_to_player = False
-        self.now = time.time()
-
-    def take_damage(self, target_pos: Pos):
-        return ((self.pos.x - target_pos.x) ** 2 + (self.pos.y - target_pos.y) ** 2) ** (1/2)
 
     def update(self, **kwargs: int) -> None:
         """Update the zombie's state and position."""
         world = kwargs.get("world")
-        if time.time() - self.now >= 1:
-            print(self.take_damage(kwargs.get("target_pos", self.pos)))
-            if self.take_damage(kwargs.get("target_pos", self.pos)) < 2:
-                self.take_damage_to_player = True
-            else:
-                self.take_damage_to_player = False
         if self.chasing:
             self.chase(world, kwargs.get("target_pos", self.pos))
         else:
@@ -92,64 +91,44 @@ class Zombie(Entity):
         self.state = curr_state
 
     def chase(self, world: "World", target_pos: Pos) -> None:
-        """Move towards the target position with seamless directional movement."""
-        dx, dy = self.prev_state.direction().value
-        next_x = self.pos.x + dx * self.step_size
-        next_y = self.pos.y + dy * self.step_size
-
-        # Check if continuing in previous direction moves toward target and is passable
-        moving_toward_target = False
-        if (
-            (self.prev_state == ZombieState.WALKING_RIGHT and self.pos.x < target_pos.x)
-            or (self.prev_state == ZombieState.WALKING_LEFT and self.pos.x > target_pos.x)
-            or (self.prev_state == ZombieState.WALKING_DOWN and self.pos.y < target_pos.y)
-            or (self.prev_state == ZombieState.WALKING_UP and self.pos.y > target_pos.y)
-        ):
-            moving_toward_target = True
-
-        if moving_toward_target and world.is_passable(next_x, next_y):
-            self.pos.x = next_x
-            self.pos.y = next_y
-            self.state = self.prev_state
-            return 
-
-        # If can't continue in previous direction, find new possible moves
-        possible_moves = []
-
-        if self.pos.x < target_pos.x:
-            next_x = self.pos.x + self.step_size
-            if world.is_passable(next_x, self.pos.y):
-                possible_moves.append(("x", self.step_size, ZombieState.WALKING_RIGHT))
-        elif self.pos.x > target_pos.x:
-            next_x = self.pos.x - self.step_size
-            if world.is_passable(next_x, self.pos.y):
-                possible_moves.append(("x", -self.step_size, ZombieState.WALKING_LEFT))
-
-        if self.pos.y < target_pos.y:
-            next_y = self.pos.y + self.step_size
-            if world.is_passable(self.pos.x, next_y):
-                possible_moves.append(("y", self.step_size, ZombieState.WALKING_DOWN))
-        elif self.pos.y > target_pos.y:
-            next_y = self.pos.y - self.step_size
-            if world.is_passable(self.pos.x, next_y):
-                possible_moves.append(("y", -self.step_size, ZombieState.WALKING_UP))
-
-        # If there are possible moves toward target, randomly choose one
-        if possible_moves:
-            axis, movement, new_state = random.choice(possible_moves)
-            if axis == "x":
-                self.pos.x += movement
-            else:
-                self.pos.y += movement
-            self.prev_state = self.state
-            self.state = new_state
-        # If no direct path to target is passable, fall back to wandering behavior
+        """Follow the shared flow field toward the target position."""
+        tile_size = world.tile_map.tile_size
+        field = world.navigation.flow_field_to(target_pos)
+        tile_x, tile_y = world.navigation.tile_of(self.pos)
+
+        if (tile_x, tile_y) == field.goal:
+            # Same tile as the target, close in on its exact position
+            goal_x, goal_y = target_pos.x, target_pos.y
         else:
-            self.prev_state = self.state
-            self.state = ZombieState.random()
-            
-
-        
+            next_tile = field.next_tile(tile_x, tile_y)
+            if next_tile is None:
+                # No path to the target, stand still facing a random direction until one opens up
+                self.prev_state = self.state
+                self.state = ZombieState.random()
+                return
+            goal_x, goal_y = next_tile[0] * tile_size, next_tile[1] * tile_size
+
+        # Close the smaller offset first so the zombie lines up with the grid
+        # before it crosses into the next tile
+        offset_x = goal_x - self.pos.x
+        offset_y = goal_y - self.pos.y
+        step_x = max(-self.step_size, min(self.step_size, offset_x))
+        step_y = max(-self.step_size, min(self.step_size, offset_y))
+        moves = [(step_x, 0), (0, step_y)]
+        if abs(offset_y) < abs(offset_x):
+            moves.reverse()
+
+        for dx, dy in moves:
+            if not dx and not dy:
+                continue
+            next_x = self.pos.x + dx
+            next_y = self.pos.y + dy
+            if world.is_passable(next_x, next_y):
+                self.pos.x = next_x
+                self.pos.y = next_y
+                self.prev_state = self.state
+                self.state = ZombieState.from_direction(dx, dy)
+                return
 
     def update_frame_idx(self) -> None:
         """Update the frame index for the zombie's sprite animation."""
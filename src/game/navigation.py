@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+from array import array
+from collections import OrderedDict, deque
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from models import Pos, TileMap
+
+UNREACHABLE = -1
+NEIGHBOURS = ((1, 0), (-1, 0), (0, 1), (0, -1))
+# Flow fields kept alive at once; one per player is enough
+MAX_FLOW_FIELDS = 4
+
+
+class FlowField:
+    """Breadth-first distance map, in tiles, from every walkable tile to a goal tile."""
+
+    def __init__(self, goal: tuple[int, int], width: int, height: int, walkable: bytearray) -> None:
+        self.goal = goal
+        self.width = width
+        self.height = height
+        self.distances = array("i", [UNREACHABLE]) * (width * height)
+        self._compute(walkable)
+
+    def _compute(self, walkable: bytearray) -> None:
+        width, height = self.width, self.height
+        distances = self.distances
+        goal_x, goal_y = self.goal
+        if not (0 <= goal_x < width and 0 <= goal_y < height):
+            return
+
+        # the goal is always seeded, even if the player stands on a partially blocked tile
+        distances[goal_y * width + goal_x] = 0
+        frontier = deque([(goal_x, goal_y)])
+        while frontier:
+            x, y = frontier.popleft()
+            next_distance = distances[y * width + x] + 1
+            for dx, dy in NEIGHBOURS:
+                nx, ny = x + dx, y + dy
+                if not (0 <= nx < width and 0 <= ny < height):
+                    continue
+                cell = ny * width + nx
+                if walkable[cell] and distances[cell] == UNREACHABLE:
+                    distances[cell] = next_distance
+                    frontier.append((nx, ny))
+
+    def distance(self, x: int, y: int) -> int:
+        """Return the distance from a tile to the goal, or UNREACHABLE."""
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            return UNREACHABLE
+        return self.distances[y * self.width + x]
+
+    def next_tile(self, x: int, y: int) -> tuple[int, int] | None:
+        """Return the neighbouring tile that is closest to the goal, if any is reachable."""
+        best = None
+        best_distance = UNREACHABLE
+        for dx, dy in NEIGHBOURS:
+            distance = self.distance(x + dx, y + dy)
+            if distance != UNREACHABLE and (best is None or distance < best_distance):
+                best = (x + dx, y + dy)
+                best_distance = distance
+        return best
+
+
+class NavigationSystem:
+    """Shares flow fields toward player tiles between every chasing NPC.
+
+    A field is only computed when a target enters a tile no cached field leads to,
+    so pathing costs O(map) per player tile change instead of probing per NPC per tick.
+    """
+
+    def __init__(self, tile_map: TileMap) -> None:
+        self.tile_map = tile_map
+        self.walkable = self._build_walkable(tile_map)
+        self._fields: OrderedDict[tuple[int, int], FlowField] = OrderedDict()
+
+    @staticmethod
+    def _build_walkable(tile_map: TileMap) -> bytearray:
+        """Mark tiles that a tile-sized entity can stand on when aligned to the grid."""
+        tile_size = tile_map.tile_size
+        grid = tile_map.collision_grid
+        walkable = bytearray(tile_map.width * tile_map.height)
+        for y in range(tile_map.height):
+            for x in range(tile_map.width):
+                if tile_map.is_passable(x, y) and grid.is_area_free(
+                    x * tile_size,
+                    y * tile_size,
+                    tile_size,
+                    tile_size,
+                ):
+                    walkable[y * tile_map.width + x] = 1
+        return walkable
+
+    def tile_of(self, pos: Pos) -> tuple[int, int]:
+        """Return the tile containing a world position."""
+        return int(pos.x // self.tile_map.tile_size), int(pos.y // self.tile_map.tile_size)
+
+    def flow_field_to(self, target: Pos) -> FlowField:
+        """Return the flow field leading to the tile of the target position."""
+        goal = self.tile_of(target)
+        field = self._fields.get(goal)
+        if field is None:
+            field = FlowField(goal, self.tile_map.width, self.tile_map.height, self.walkable)
+            self._fields[goal] = field
+            while len(self._fields) > MAX_FLOW_FIELDS:
+                self._fields.popitem(last=False)
+        else:
+            self._fields.move_to_end(goal)
+        return field
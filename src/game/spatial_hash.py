@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from game.entities.entity import Entity
+
+Cell = tuple[int, int]
+
+
+class SpatialHash:
+    """Uniform grid that buckets entities by the cell containing their position.
+
+    Queries only visit the cells overlapping the queried area, so their cost depends
+    on how crowded that area is rather than on the number of entities in the world.
+    Entities move by mutating ``pos`` directly, so owners must call ``update`` after
+    an entity may have moved.
+    """
+
+    def __init__(self, cell_size: int) -> None:
+        self.cell_size = cell_size
+        # dicts keep insertion order and give O(1) removal
+        self._cells: dict[Cell, dict[Entity, None]] = {}
+        self._entity_cells: dict[Entity, Cell] = {}
+
+    def __len__(self) -> int:
+        return len(self._entity_cells)
+
+    def __contains__(self, entity: Entity) -> bool:
+        return entity in self._entity_cells
+
+    def cell_of(self, x: float, y: float) -> Cell:
+        """Return the cell containing a world position."""
+        return int(x // self.cell_size), int(y // self.cell_size)
+
+    def insert(self, entity: Entity) -> None:
+        """Start tracking an entity."""
+        if entity in self._entity_cells:
+            self.update(entity)
+            return
+        cell = self.cell_of(entity.pos.x, entity.pos.y)
+        self._entity_cells[entity] = cell
+        self._cells.setdefault(cell, {})[entity] = None
+
+    def remove(self, entity: Entity) -> None:
+        """Stop tracking an entity."""
+        cell = self._entity_cells.pop(entity, None)
+        if cell is None:
+            return
+        bucket = self._cells[cell]
+        del bucket[entity]
+        if not bucket:
+            del self._cells[cell]
+
+    def update(self, entity: Entity) -> None:
+        """Move an entity to the bucket matching its current position."""
+        old_cell = self._entity_cells.get(entity)
+        new_cell = self.cell_of(entity.pos.x, entity.pos.y)
+        if old_cell == new_cell:
+            return
+        if old_cell is not None:
+            self.remove(entity)
+        self._entity_cells[entity] = new_cell
+        self._cells.setdefault(new_cell, {})[entity] = None
+
+    def clear(self) -> None:
+        """Forget every tracked entity."""
+        self._cells.clear()
+        self._entity_cells.clear()
+
+    def query_rect(self, x0: float, y0: float, x1: float, y1: float) -> list[Entity]:
+        """Return the entities positioned inside the inclusive rectangle (x0, y0)-(x1, y1)."""
+        col0, row0 = self.cell_of(x0, y0)
+        col1, row1 = self.cell_of(x1, y1)
+        result = []
+        for row in range(row0, row1 + 1):
+            for col in range(col0, col1 + 1):
+                bucket = self._cells.get((col, row))
+                if not bucket:
+                    continue
+                result.extend(e for e in bucket if x0 <= e.pos.x <= x1 and y0 <= e.pos.y <= y1)
+        return result
+
+    def query_point(self, x: float, y: float) -> list[Entity]:
+        """Return the entities positioned exactly at a world position."""
+        bucket = self._cells.get(self.cell_of(x, y))
+        if not bucket:
+            return []
+        return [entity for entity in bucket if entity.pos.x == x and entity.pos.y == y]
@@ -1,18 +1,42 @@
 from __future__ import annotations
 
-import copy
+from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
 from engine.event_bus import EventType, GameEvent
-from game import Player
+from game import Player, Zombie
 from models import Pos, TileMap
 from game.inventory import Inventory, Item
+from game.navigation import NavigationSystem
+from game.spatial_hash import SpatialHash
 from ui.inventory import InventoryOverlay
 
 if TYPE_CHECKING:
     from engine.event_bus import EventBus
-    from game import Zombie
-    from game.entities.entity import Entity
+    from game.entities.entity import Entity, EntitySnapshot
+
+
+# Side of a spatial hash cell, in tiles
+SPATIAL_CELL_TILES = 2
+
+# Zombies within ZOMBIE_ATTACK_RANGE of the player hit it for ZOMBIE_ATTACK_DAMAGE hp
+# every ZOMBIE_ATTACK_INTERVAL seconds, the once a second the zombies' attack check was meant to run
+ZOMBIE_ATTACK_INTERVAL = 1.0
+ZOMBIE_ATTACK_RANGE = 2  # in pixels, between the zombie's and the player's positions
+ZOMBIE_ATTACK_DAMAGE = 0.5
+
+
+@dataclass(slots=True)
+class WorldSnapshot:
+    """Mutable world state captured by `World.snapshot`.
+
+    Only per-entity state and the inventory are recorded; the tile map is static and shared by reference.
+    """
+
+    entities: list[EntitySnapshot]
+    players: list[Player]
+    zombies: list[Zombie]
+    inventory: dict[str, Item]
 
 
 class World():
@@ -29,6 +53,9 @@ class World():
         self.players: list[Player] = []
         self.entities = []
         self.zombies: list[Zombie] = []
+        self.tile_map = tile_map
+        self.spatial_index = SpatialHash(cell_size=tile_map.tile_size * SPATIAL_CELL_TILES)
+        self.navigation = NavigationSystem(tile_map)
 
         self.inventory: Inventory = inventory
         self.inventory_ui: InventoryOverlay = InventoryOverlay(self.inventory)
@@ -41,30 +68,43 @@ class World():
             self.zombies.append(zombie)
             self.add_entity(zombie)
 
-        self.tile_map = tile_map
-        # create a deep copy of the original state of the world
-        self._original_tile_map = copy.deepcopy(tile_map)
-        self._original_entities = copy.deepcopy(self.entities)
+        # remember the original state of the world for new games
+        self._initial_snapshot = self.snapshot()
+
+    def snapshot(self) -> WorldSnapshot:
+        """Capture the mutable state of every entity in the world, and the inventory."""
+        return WorldSnapshot(
+            entities=[entity.snapshot() for entity in self.entities],
+            players=list(self.players),
+            zombies=list(self.zombies),
+            inventory=self.inventory.return_all_items(),
+        )
+
+    def restore(self, snapshot: WorldSnapshot) -> None:
+        """Restore the world in place to a previously captured state."""
+        self.entities = [entity_snapshot.entity for entity_snapshot in snapshot.entities]
+        for entity_snapshot in snapshot.entities:
+            entity_snapshot.restore()
+        self.players = list(snapshot.players)
+        self.zombies = list(snapshot.zombies)
+        self.inventory.slots = dict(snapshot.inventory)
+        self.inventory_ui.items = self.inventory.return_all_items()
+
+        self.spatial_index.clear()
+        for entity in self.entities:
+            self.spatial_index.insert(entity)
 
     def reset_world(self) -> None:
         """Reset the world to its original state."""
-        self.tile_map = copy.deepcopy(self._original_tile_map)
-        self.entities = copy.deepcopy(self._original_entities)
-        self.players = []
-        for player in self._original_entities:
-            if isinstance(player, Player):
-                self.add_player(player)
+        self.restore(self._initial_snapshot)
 
     def find_near(self, pos: Pos, radius: int) -> list[Entity]:
         """Find all entities within `radius` of the given position using Chebyshev distance."""
-        result = []
-        for e in self.entities:
-            dx = abs(e.pos.x - pos.x)
-            dy = abs(e.pos.y - pos.y)
-            distance = max(dx, dy)
-            if distance <= radius:
-                result.append(e)
-        return result
+        return self.spatial_index.query_rect(pos.x - radius, pos.y - radius, pos.x + radius, pos.y + radius)
+
+    def find_in_rect(self, x0: float, y0: float, x1: float, y1: float) -> list[Entity]:
+        """Find all entities positioned inside the inclusive rectangle (x0, y0)-(x1, y1)."""
+        return self.spatial_index.query_rect(x0, y0, x1, y1)
 
     def is_passable(self, x: int, y: int) -> bool:
         """Check if a location is passable in the tile map."""
@@ -76,48 +116,32 @@ class World():
             return False
 
         # Then check if any entity at this position blocks movement
-        for entity in self.entities:
+        for entity in self.spatial_index.query_point(x, y):
             if (
-                entity.pos.x == x
-                and entity.pos.y == y
-                and hasattr(entity, "behaviour")
+                hasattr(entity, "behaviour")
                 and entity.behaviour
                 and (entity.behaviour, "passable")
                 and not entity.behaviour.passable
             ):
                 return False
 
-        # If all checks pass, the location is considered passable
-        for box in self.tile_map.collision_boxes:
-            # player has width and height
-            # check rectangle collision
-            player_width, player_height = (
-                self.tile_map.tile_size,
-                self.tile_map.tile_size,
-            )
-
-            def rects_overlap(r1: tuple, r2: tuple) -> bool:
-                x1, y1, w1, h1 = r1
-                x2, y2, w2, h2 = r2
-                return x1 < x2 + w2 and x1 + w1 > x2 and y1 < y2 + h2 and y1 + h1 > y2
-
-            if rects_overlap(
-                (box.x, box.y, box.width, box.height),
-                (x, y, player_width, player_height),
-            ):
-                return box.passable
-
-        return True
+        # Finally check the rasterized collision boxes under the entity-sized footprint
+        return self.tile_map.collision_grid.is_area_free(
+            x,
+            y,
+            self.tile_map.tile_size,
+            self.tile_map.tile_size,
+        )
 
     def update(self, dt: float, event_bus: EventBus) -> None:
         """Update all entities in the world."""
-        events = event_bus.get_events()
-
-        # Damage the player
-        for player, zombie in zip(self.players, self.zombies):
-            if zombie.take_damage_to_player:
-                print(player.hp)
-                player.take_damage(0.5)
+        events = event_bus.get_events(
+            EventType.NEW_GAME,
+            EventType.MOUSE_CLICK,
+            EventType.INPUT,
+            EventType.INVENTORY_CHANGE,
+            EventType.ZOMBIE_ATTACK,
+        )
 
         for event in events:
             if event.event_type == EventType.NEW_GAME:
@@ -141,14 +165,37 @@ class World():
             elif event.event_type == EventType.INVENTORY_CHANGE:
                 self._handle_inventory_change(event.payload)
                 event.consume()
+            elif event.event_type == EventType.ZOMBIE_ATTACK:
+                self._handle_zombie_attack()
+                event.consume()
         for e in self.entities:
+            e.store_previous_position()
             e.update(
                 time_delta=dt,
-                events=events,
+                event_bus=event_bus,
                 world=self,
                 target_pos=self.get_current_player().pos,
             )
+            self.spatial_index.update(e)
+
 
+    def schedule_timers(self, event_bus: EventBus) -> None:
+        """Schedule the world's periodic events on the event bus."""
+        event_bus.schedule(
+            EventType.ZOMBIE_ATTACK,
+            delay=ZOMBIE_ATTACK_INTERVAL,
+            interval=ZOMBIE_ATTACK_INTERVAL,
+        )
+
+    def _handle_zombie_attack(self) -> None:
+        """Damage the player for every zombie in attack range."""
+        player = self.get_current_player()
+        for entity in self.find_near(player.pos, ZOMBIE_ATTACK_RANGE):
+            if not isinstance(entity, Zombie):
+                continue
+            distance = ((entity.pos.x - player.pos.x) ** 2 + (entity.pos.y - player.pos.y) ** 2) ** 0.5
+            if distance < ZOMBIE_ATTACK_RANGE:
+                player.take_damage(ZOMBIE_ATTACK_DAMAGE)
 
     def _handle_inventory_change(self, payload: dict) -> None:
         """Handle inventory change events."""
@@ -169,9 +216,15 @@ class World():
         self,
         tile_x: int,
         tile_y: int,
-        entities: list[Entity],
+        entities: list[Entity] | None = None,
     ) -> Entity | None:
-        """Check if a click event intersects with any entity."""
+        """Check if a click event intersects with any entity.
+
+        Without explicit candidate `entities`, the spatial index is queried around the click.
+        """
+        if entities is None:
+            tile_size = self.tile_map.tile_size
+            entities = self.find_in_rect(tile_x - tile_size, tile_y - tile_size, tile_x, tile_y)
         clickable_entities = []
         for entity in entities:
             entity_world_x, entity_world_y = entity.pos.x, entity.pos.y
@@ -211,11 +264,13 @@ class World():
     def add_entity(self, entity: Entity) -> None:
         """Add an entity to the world."""
         self.entities.append(entity)
+        self.spatial_index.insert(entity)
 
     def remove_entity(self, entity: Entity) -> None:
         """Remove an entity from the world."""
         if entity in self.entities:
             self.entities.remove(entity)
+            self.spatial_index.remove(entity)
 
     def add_player(self, player: Player) -> None:
         """Add a player to the world."""
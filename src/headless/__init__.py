@@ -0,0 +1,98 @@
+"""Headless backend that lets the engine run under plain CPython.
+
+Pyodide exposes the browser through the `js`, `pyodide` and `pyodide_js` modules. `install()`
+registers local stand-ins for them, so it must be called before importing any
+game module:
+
+    import headless
+    headless.install()
+
+    import main
+    engine = asyncio.run(main.create_engine())
+"""
+
+from __future__ import annotations
+
+import sys
+import types
+from pathlib import Path
+
+from headless import dom, ffi, http
+
+# repository root, where the `assets/` directory lives
+DEFAULT_ASSET_ROOT = Path(__file__).resolve().parents[2]
+
+
+def is_installed() -> bool:
+    """Check if the headless stand-ins are the active `js` module."""
+    return getattr(sys.modules.get("js"), "__headless__", False)
+
+
+def install(
+    asset_root: Path = DEFAULT_ASSET_ROOT,
+    screen_size: tuple[int, int] = dom.DEFAULT_SCREEN_SIZE,
+) -> types.ModuleType:
+    """Register the `js`, `pyodide.ffi`, `pyodide.http` and `pyodide_js` stand-ins and return `js`."""
+    if sys.platform == "emscripten":
+        msg = "The headless backend can't be installed inside Pyodide"
+        raise RuntimeError(msg)
+    if is_installed():
+        return sys.modules["js"]
+
+    dom.Image.asset_root = Path(asset_root)
+    document = dom.Document(screen_size)
+    performance = dom.Performance()
+    window = dom.Window(document, performance, screen_size)
+
+    js = types.ModuleType("js")
+    js.__headless__ = True
+    js.document = document
+    js.window = window
+    js.performance = performance
+    js.Image = dom.Image
+    js.Audio = dom.Audio
+    js.Math = dom.JsMath
+    js.Object = dom.JsObject
+    js.Float32Array = dom.Float32Array
+    js.Uint8Array = dom.Uint8Array
+    js.Blob = dom.Blob
+    js.URL = dom.URL
+    js.Response = dom.Response
+    js.Event = dom.Event
+    js.KeyBoardEvent = dom.KeyBoardEvent
+    js.MouseEvent = dom.MouseEvent
+    js.HTMLCanvasElement = dom.HTMLCanvasElement
+    js.HTMLDivElement = dom.HTMLDivElement
+    js.CanvasRenderingContext2D = dom.CanvasRenderingContext2D
+
+    pyodide = types.ModuleType("pyodide")
+    pyodide.__path__ = []
+    pyodide_ffi = types.ModuleType("pyodide.ffi")
+    pyodide_ffi.create_proxy = ffi.create_proxy
+    pyodide_ffi.to_js = ffi.to_js
+    pyodide_ffi.JsProxy = ffi.JsProxy
+    pyodide_http = types.ModuleType("pyodide.http")
+    pyodide_http.pyfetch = http.Fetcher(Path(asset_root))
+    pyodide.ffi = pyodide_ffi
+    pyodide.http = pyodide_http
+    pyodide_js = types.ModuleType("pyodide_js")
+    pyodide_js.loadPackage = _load_package
+
+    sys.modules.update(
+        {
+            "js": js,
+            "pyodide": pyodide,
+            "pyodide.ffi": pyodide_ffi,
+            "pyodide.http": pyodide_http,
+            "pyodide_js": pyodide_js,
+        },
+    )
+    return js
+
+
+async def _load_package(*_args: object, **_kwargs: object) -> None:
+    # packages come from the local environment
+    return None
+
+
+__all__ = ["DEFAULT_ASSET_ROOT", "install", "is_installed"]
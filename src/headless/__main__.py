@@ -0,0 +1,108 @@
+"""Run the game headless.
+
+`render` drives the real browser game loop for a number of frames, `simulate`
+fast-forwards the simulation without rendering, e.g.
+`PYTHONPATH=src python -m headless simulate --ticks 36000 --zombies 200`.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import sys
+from pathlib import Path
+
+import headless
+
+
+def render(frames: int, asset_cache: Path | None, startup_budget: float | None) -> int:
+    js = headless.install()
+
+    from startup import profiler  # noqa: PLC0415 - game modules need the stand-ins installed first
+
+    if startup_budget is not None:
+        profiler.budget_ms = startup_budget
+    profiler.install_import_timer()
+    with profiler.phase("import main"):
+        import main  # noqa: PLC0415
+    from engine import VirtualClock  # noqa: PLC0415
+    from engine.assets import MemoryAssetCache  # noqa: PLC0415
+    from engine.event_bus import EventType, GameEvent  # noqa: PLC0415
+    from engine.proxies import proxy_manager  # noqa: PLC0415
+    from headless.cache import DirectoryAssetCache  # noqa: PLC0415
+
+    # one simulation step per frame, as on a 60 Hz display
+    clock = VirtualClock()
+    cache = DirectoryAssetCache(asset_cache) if asset_cache else MemoryAssetCache()
+    with profiler.phase("create engine"):
+        engine = asyncio.run(main.create_engine(clock=clock, asset_cache=cache))
+    report = profiler.finish()
+    engine.event_bus.post(GameEvent(event_type=EventType.GAME_RESUMED, payload={}))
+
+    start = js.performance.now()
+    main.run_game_loop(engine)
+    ran = 0
+    while ran < frames:
+        ran += js.window.run_animation_frames(1)
+        clock.advance(engine.dt)
+    elapsed = js.performance.now() - start
+
+    ctx = engine.renderer.view_bridge.ctx
+    print(f"frames: {ran}, {elapsed:.1f} ms, {ran / (elapsed / 1000):.1f} fps")
+    print(f"canvas calls: {dict(ctx.calls)}")
+    print(f"live proxies: {proxy_manager.live_count}")
+    stats = engine.renderer.batch_stats
+    print(f"last frame: {stats.draws} world draws in {stats.batches} image batches")
+    # a startup over budget fails the run
+    return 1 if report["over_budget"] else 0
+
+
+def simulate(ticks: int, zombies: int, seed: int | None) -> None:
+    headless.install()
+
+    import main  # noqa: PLC0415 - game modules need the stand-ins installed first
+    from engine import VirtualClock  # noqa: PLC0415
+    from headless.runner import SimulationRunner  # noqa: PLC0415
+
+    if seed is not None:
+        # fruit spawns and zombie wandering draw from the global generator
+        random.seed(seed)
+    engine = asyncio.run(main.create_engine(clock=VirtualClock()))
+    runner = SimulationRunner(engine)
+    runner.spawn_zombies(zombies, seed=seed)
+    runner.resume()
+    print(f"entities: {len(engine.world.entities)}")
+    print(runner.run(ticks=ticks).format())
+    print(f"event bus: {engine.event_bus.stats}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    render_parser = commands.add_parser("render", help="run the browser game loop")
+    render_parser.add_argument("--frames", type=int, default=600, help="number of frames to run")
+    render_parser.add_argument(
+        "--startup-budget",
+        type=float,
+        default=None,
+        help="startup budget in ms, the run fails when startup exceeds it",
+    )
+    render_parser.add_argument(
+        "--asset-cache",
+        type=Path,
+        default=None,
+        help="directory to keep fetched assets in between runs, to measure warm starts",
+    )
+
+    simulate_parser = commands.add_parser("simulate", help="fast-forward the simulation without rendering")
+    simulate_parser.add_argument("--ticks", type=int, default=3600, help="number of ticks to simulate")
+    simulate_parser.add_argument("--zombies", type=int, default=0, help="extra zombies to spawn")
+    simulate_parser.add_argument("--seed", type=int, default=None, help="seed for a reproducible run")
+
+    args = parser.parse_args()
+    if args.command == "render":
+        sys.exit(render(args.frames, args.asset_cache, args.startup_budget))
+    else:
+        simulate(args.ticks, args.zombies, args.seed)
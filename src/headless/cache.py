@@ -0,0 +1,35 @@
+"""Filesystem stand-in for the browser's persistent asset cache."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from engine.assets import AssetCache
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+class DirectoryAssetCache(AssetCache):
+    """Keeps cached files under a directory, as `<path>@<version>`, so warm starts can be measured."""
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+
+    def _entry(self, path: str, version: str) -> Path:
+        return self.root / f"{path}@{version}"
+
+    async def get(self, path: str, version: str) -> bytes | None:
+        """Return the stored content of `path` at `version`, or None if it isn't stored."""
+        try:
+            return self._entry(path, version).read_bytes()
+        except OSError:
+            return None
+
+    async def put(self, path: str, version: str, data: bytes) -> None:
+        """Store the content of `path` at `version`."""
+        entry = self._entry(path, version)
+        entry.parent.mkdir(parents=True, exist_ok=True)
+        for stale in entry.parent.glob(f"{entry.name.rpartition('@')[0]}@*"):
+            stale.unlink()
+        entry.write_bytes(data)
@@ -0,0 +1,462 @@
+"""Minimal stand-ins for the browser globals the game reads from the `js` module."""
+
+from __future__ import annotations
+
+import math
+import struct
+import time
+from array import array
+from collections import Counter
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, ClassVar
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+DEFAULT_SCREEN_SIZE = (1920, 1080)
+
+# How many elements `querySelectorAll` finds for selectors of the HTML components
+COMPONENT_ELEMENT_COUNTS = {
+    ".dialog-btn": 3,
+    ".inventory-slot": 18,
+}
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+
+class ClassList:
+    """Stand-in for `DOMTokenList`."""
+
+    def __init__(self) -> None:
+        self._classes: set[str] = set()
+
+    def add(self, *names: str) -> None:
+        self._classes.update(names)
+
+    def remove(self, *names: str) -> None:
+        self._classes.difference_update(names)
+
+    def contains(self, name: str) -> bool:
+        return name in self._classes
+
+    def toggle(self, name: str) -> bool:
+        if name in self._classes:
+            self._classes.remove(name)
+            return False
+        self._classes.add(name)
+        return True
+
+
+class Style:
+    """Stand-in for `CSSStyleDeclaration`, any property can be assigned."""
+
+    def __init__(self) -> None:
+        self.display = ""
+
+    def setProperty(self, name: str, value: str) -> None:  # noqa: N802
+        setattr(self, name, value)
+
+
+@dataclass
+class Rect:
+    left: float = 0
+    top: float = 0
+    width: float = 0
+    height: float = 0
+
+
+@dataclass
+class TextMetrics:
+    width: float
+
+
+class Event:
+    """Stand-in for DOM events, carrying whatever fields the handler reads."""
+
+    def __init__(self, event_type: str = "", **fields: Any) -> None:  # noqa: ANN401
+        self.type = event_type
+        self.isTrusted = True
+        self.defaultPrevented = False
+        for name, value in fields.items():
+            setattr(self, name, value)
+
+    def preventDefault(self) -> None:  # noqa: N802
+        self.defaultPrevented = True
+
+
+class EventTarget:
+    def __init__(self) -> None:
+        self._listeners: dict[str, list[Callable]] = {}
+
+    def addEventListener(self, event_type: str, listener: Callable) -> None:  # noqa: N802
+        self._listeners.setdefault(event_type, []).append(listener)
+
+    def removeEventListener(self, event_type: str, listener: Callable) -> None:  # noqa: N802
+        listeners = self._listeners.get(event_type, [])
+        if listener in listeners:
+            listeners.remove(listener)
+
+    def dispatchEvent(self, event: Event) -> None:  # noqa: N802
+        for listener in list(self._listeners.get(event.type, [])):
+            listener(event)
+
+
+class CanvasRenderingContext2D:
+    """Canvas 2d context that only counts the calls made to it."""
+
+    def __init__(self, canvas: HTMLCanvasElement) -> None:
+        self.canvas = canvas
+        self.calls: Counter[str] = Counter()
+        self.fillStyle = "#000"
+        self.strokeStyle = "#000"
+        self.lineWidth = 1
+        self.font = "10px sans-serif"
+        self.textAlign = "start"
+        self.globalAlpha = 1.0
+
+    def measureText(self, text: str) -> TextMetrics:  # noqa: N802
+        self.calls["measureText"] += 1
+        return TextMetrics(width=len(text) * 8)
+
+    def __getattr__(self, name: str) -> Callable[..., None]:
+        # every other drawing call (drawImage, save, fillRect, ...) is just counted
+        if name.startswith("_"):
+            raise AttributeError(name)
+
+        def record(*_args: object) -> None:
+            self.calls[name] += 1
+
+        return record
+
+
+class Element(EventTarget):
+    """Stand-in for DOM elements. Lookups never fail, elements are created on demand."""
+
+    def __init__(self, tag: str = "div", document: Document | None = None) -> None:
+        super().__init__()
+        self.tagName = tag.upper()
+        self.id = ""
+        self.style = Style()
+        self.classList = ClassList()
+        self.children: list[Element] = []
+        self.attributes: dict[str, str] = {}
+        self.textContent = ""
+        self.innerHTML = ""
+        self.value = ""
+        self.disabled = False
+        self.onclick = None
+        self.onchange = None
+        self.clientWidth = 0
+        self.clientHeight = 0
+        self._document = document
+        self._selected: dict[str, Element] = {}
+
+    def querySelector(self, selector: str) -> Element:  # noqa: N802
+        if selector not in self._selected:
+            self._selected[selector] = Element(document=self._document)
+        return self._selected[selector]
+
+    def querySelectorAll(self, selector: str) -> list[Element]:  # noqa: N802
+        key = f"all:{selector}"
+        if key not in self._selected:
+            count = COMPONENT_ELEMENT_COUNTS.get(selector, 0)
+            self._selected[key] = [Element(document=self._document) for _ in range(count)]
+        return self._selected[key]
+
+    def appendChild(self, child: Element) -> Element:  # noqa: N802
+        self.children.append(child)
+        return child
+
+    def setAttribute(self, name: str, value: str) -> None:  # noqa: N802
+        self.attributes[name] = value
+
+    def getAttribute(self, name: str) -> str | None:  # noqa: N802
+        return self.attributes.get(name)
+
+    def getBoundingClientRect(self) -> Rect:  # noqa: N802
+        return Rect(width=self.clientWidth, height=self.clientHeight)
+
+    def click(self) -> None:
+        """Simulate a user click on this element."""
+        event = Event("click")
+        if self.onclick:
+            self.onclick(event)
+        self.dispatchEvent(event)
+
+
+class HTMLCanvasElement(Element):
+    def __init__(self, document: Document | None = None) -> None:
+        super().__init__("canvas", document)
+        self.width = 300
+        self.height = 150
+        self._context: CanvasRenderingContext2D | None = None
+
+    def getContext(self, _kind: str = "2d", **_options: object) -> CanvasRenderingContext2D:  # noqa: N802
+        if self._context is None:
+            self._context = CanvasRenderingContext2D(self)
+        return self._context
+
+
+class HTMLDivElement(Element):
+    pass
+
+
+class Document(Element):
+    def __init__(self, screen_size: tuple[int, int] = DEFAULT_SCREEN_SIZE) -> None:
+        super().__init__("html", self)
+        self._by_id: dict[str, Element] = {}
+        self.documentElement = Element("html", self)
+        self.documentElement.clientWidth, self.documentElement.clientHeight = screen_size
+
+    def getElementById(self, element_id: str) -> Element:  # noqa: N802
+        if element_id not in self._by_id:
+            element = HTMLCanvasElement(self) if element_id.endswith("Canvas") else Element(document=self)
+            element.id = element_id
+            self._by_id[element_id] = element
+        return self._by_id[element_id]
+
+    def createElement(self, tag: str) -> Element:  # noqa: N802
+        if tag.lower() == "canvas":
+            return HTMLCanvasElement(self)
+        return Element(tag, self)
+
+
+class Window(EventTarget):
+    """Stand-in for `window`, animation frames run when `run_animation_frames` is called."""
+
+    def __init__(self, document: Document, performance: Performance, screen_size: tuple[int, int]) -> None:
+        super().__init__()
+        self.document = document
+        self.performance = performance
+        self.innerWidth, self.innerHeight = screen_size
+        self._frame_callbacks: dict[int, Callable[[float], None]] = {}
+        self._next_handle = 0
+        self._draw_images: dict[int, object] = {}
+
+    def requestAnimationFrame(self, callback: Callable[[float], None]) -> int:  # noqa: N802
+        self._next_handle += 1
+        self._frame_callbacks[self._next_handle] = callback
+        return self._next_handle
+
+    def cancelAnimationFrame(self, handle: int) -> None:  # noqa: N802
+        self._frame_callbacks.pop(handle, None)
+
+    def run_animation_frames(self, count: int = 1) -> int:
+        """Run `count` animation frames, returns how many callbacks were invoked."""
+        invoked = 0
+        for _ in range(count):
+            callbacks, self._frame_callbacks = self._frame_callbacks, {}
+            if not callbacks:
+                break
+            timestamp = self.performance.now()
+            for callback in callbacks.values():
+                callback(timestamp)
+                invoked += 1
+        return invoked
+
+    def registerDrawImage(self, image_id: int, image: object) -> None:  # noqa: N802
+        self._draw_images[image_id] = image
+
+    def executeDrawBuffer(self, ctx: CanvasRenderingContext2D, buffer: Float32Array, count: int) -> None:  # noqa: N802
+        """Replay the records like `executeDrawBuffer` in js/index.js does."""
+        record_size = 11
+        for i in range(count):
+            image_id, sx, sy, sw, sh, dx, dy, dw, dh, rotation, opacity = buffer[
+                i * record_size : (i + 1) * record_size
+            ]
+            image = self._draw_images.get(int(image_id))
+            if image is None:
+                continue
+            transformed = rotation != 0 or opacity != 1
+            if transformed:
+                ctx.save()
+                ctx.globalAlpha = opacity
+                ctx.translate(dx + dw / 2, dy + dh / 2)
+                ctx.rotate(rotation)
+                dx, dy = -dw / 2, -dh / 2
+            if sw > 0:
+                ctx.drawImage(image, sx, sy, sw, sh, dx, dy, dw, dh)
+            else:
+                ctx.drawImage(image, dx, dy, dw, dh)
+            if transformed:
+                ctx.restore()
+
+
+class TypedArray:
+    """Stand-in for a JS typed array; `subarray` views share memory like in JS."""
+
+    TYPECODE = "B"
+
+    def __init__(self, data: memoryview) -> None:
+        self._data = data
+
+    @classmethod
+    def new(cls, length: int) -> TypedArray:
+        return cls(memoryview(array(cls.TYPECODE, bytes(array(cls.TYPECODE).itemsize * length))))
+
+    @property
+    def length(self) -> int:
+        return len(self._data)
+
+    def __getitem__(self, index: int | slice) -> float | list[float]:
+        if isinstance(index, slice):
+            return self._data[index].tolist()
+        return self._data[index]
+
+    def subarray(self, start: int, end: int) -> TypedArray:
+        return type(self)(self._data[start:end])
+
+    def assign(self, source: memoryview) -> None:
+        """Copy a Python buffer in, like `JsProxy.assign` it must have the same length."""
+        source = memoryview(source)
+        if len(source) != len(self._data):
+            msg = "TypedArray.assign: buffer has the wrong length"
+            raise ValueError(msg)
+        self._data[:] = source
+
+    def to_bytes(self) -> bytes:
+        return self._data.tobytes()
+
+
+class Float32Array(TypedArray):
+    TYPECODE = "f"
+
+
+class Uint8Array(TypedArray):
+    TYPECODE = "B"
+
+
+class Blob:
+    def __init__(self, parts: list[TypedArray | bytes]) -> None:
+        self.data = b"".join(part.to_bytes() if isinstance(part, TypedArray) else bytes(part) for part in parts)
+        self.size = len(self.data)
+
+    @classmethod
+    def new(cls, parts: list[TypedArray | bytes], *_options: object) -> Blob:
+        return cls(parts)
+
+
+class URL:
+    """Stand-in for the `URL` object URL functions; blob URLs resolve to the blob's bytes."""
+
+    blobs: ClassVar[dict[str, Blob]] = {}
+    _next_id = 0
+
+    @classmethod
+    def createObjectURL(cls, blob: Blob) -> str:  # noqa: N802
+        cls._next_id += 1
+        url = f"blob:headless/{cls._next_id}"
+        cls.blobs[url] = blob
+        return url
+
+    @classmethod
+    def revokeObjectURL(cls, url: str) -> None:  # noqa: N802
+        cls.blobs.pop(url, None)
+
+
+class Response:
+    def __init__(self, body: TypedArray | bytes | None = None) -> None:
+        self._body = body.to_bytes() if isinstance(body, TypedArray) else bytes(body or b"")
+
+    @classmethod
+    def new(cls, body: TypedArray | bytes | None = None, *_options: object) -> Response:
+        return cls(body)
+
+    async def arrayBuffer(self) -> Uint8Array:  # noqa: N802
+        return Uint8Array(memoryview(bytearray(self._body)))
+
+
+class Performance:
+    def __init__(self) -> None:
+        self._origin = time.perf_counter()
+
+    def now(self) -> float:
+        """Milliseconds since the stand-in was installed, like `performance.now()`."""
+        return (time.perf_counter() - self._origin) * 1000
+
+
+class MediaElement(EventTarget):
+    def __init__(self) -> None:
+        super().__init__()
+        self.src = ""
+        self.volume = 1.0
+        self.loop = False
+        self.paused = True
+
+    @classmethod
+    def new(cls, *_args: object) -> MediaElement:
+        return cls()
+
+    def play(self) -> None:
+        self.paused = False
+
+    def pause(self) -> None:
+        self.paused = True
+
+
+class Audio(MediaElement):
+    pass
+
+
+class Image(EventTarget):
+    """Stand-in for `HTMLImageElement`; reads the PNG header for its size."""
+
+    asset_root = Path()
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._src = ""
+        self.complete = True
+        self.naturalWidth = 0
+        self.naturalHeight = 0
+
+    @classmethod
+    def new(cls, *_args: object) -> Image:
+        return cls()
+
+    @property
+    def src(self) -> str:
+        return self._src
+
+    @src.setter
+    def src(self, value: str) -> None:
+        self._src = value
+        if value in URL.blobs:
+            header = URL.blobs[value].data[:24]
+        else:
+            header = _read_header(self.asset_root / value) if value else b""
+        self.naturalWidth, self.naturalHeight = _png_size(header)
+
+    async def decode(self) -> None:
+        return None
+
+
+def _read_header(path: Path) -> bytes:
+    try:
+        with path.open("rb") as file:
+            return file.read(24)
+    except OSError:
+        return b""
+
+
+def _png_size(header: bytes) -> tuple[int, int]:
+    if not header.startswith(PNG_SIGNATURE):
+        return 0, 0
+    return struct.unpack(">II", header[16:24])
+
+
+class KeyBoardEvent(Event):
+    pass
+
+
+class MouseEvent(Event):
+    pass
+
+
+class JsObject:
+    fromEntries = staticmethod(dict)  # noqa: N815
+
+
+class JsMath:
+    PI = math.pi
@@ -0,0 +1,34 @@
+"""Stand-in for `pyodide.ffi`."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+class JsProxy:
+    """Callable wrapper mimicking a proxy created with `create_proxy`."""
+
+    def __init__(self, obj: Callable) -> None:
+        self._obj = obj
+        self.destroyed = False
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:  # noqa: ANN401
+        if self.destroyed:
+            msg = "This borrowed proxy was automatically destroyed"
+            raise RuntimeError(msg)
+        return self._obj(*args, **kwargs)
+
+    def destroy(self) -> None:
+        self.destroyed = True
+
+
+def create_proxy(obj: Callable) -> JsProxy:
+    return JsProxy(obj)
+
+
+def to_js(obj: object, **_options: object) -> object:
+    # there is no JS heap to copy into, hand the Python object over as-is
+    return obj
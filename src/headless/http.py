@@ -0,0 +1,47 @@
+"""Stand-in for `pyodide.http`, serving files from the local asset root."""
+
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+HTTP_OK = 200
+HTTP_NOT_FOUND = 404
+
+
+class FetchResponse:
+    def __init__(self, url: str, body: bytes | None) -> None:
+        self.url = url
+        self._body = body or b""
+        self.status = HTTP_OK if body is not None else HTTP_NOT_FOUND
+        self.ok = body is not None
+
+    async def bytes(self) -> bytes:
+        return self._body
+
+    async def memoryview(self) -> memoryview:
+        return memoryview(self._body)
+
+    async def string(self) -> str:
+        return self._body.decode()
+
+    async def text(self) -> str:
+        return self._body.decode()
+
+    async def json(self) -> object:
+        return json.loads(self._body)
+
+
+class Fetcher:
+    def __init__(self, asset_root: Path) -> None:
+        self.asset_root = asset_root
+
+    async def __call__(self, url: str, **_kwargs: object) -> FetchResponse:
+        try:
+            body = (self.asset_root / url).read_bytes()
+        except OSError:
+            body = None
+        return FetchResponse(url, body)
@@ -0,0 +1,143 @@
+"""Fast-forward simulation of the game without rendering."""
+
+from __future__ import annotations
+
+import random
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from engine import VirtualClock
+from engine.event_bus import EventType, GameEvent
+from game import Zombie
+from models import Pos
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from engine import GameEngine
+
+DEFAULT_DT = 1 / 60
+
+
+@dataclass
+class SimulationReport:
+    """Outcome of a `SimulationRunner.run` call."""
+
+    ticks: int
+    simulated_seconds: float
+    wall_seconds: float
+    system_seconds: dict[str, float] = field(default_factory=dict)
+
+    @property
+    def ticks_per_second(self) -> float:
+        return self.ticks / self.wall_seconds if self.wall_seconds else 0.0
+
+    def format(self) -> str:
+        """Return a human readable summary."""
+        lines = [
+            f"ticks: {self.ticks} ({self.simulated_seconds:.1f} s simulated) in {self.wall_seconds:.3f} s",
+            f"ticks/sec: {self.ticks_per_second:.1f} "
+            f"({self.simulated_seconds / self.wall_seconds if self.wall_seconds else 0:.1f}x real time)",
+        ]
+        for name, seconds in sorted(self.system_seconds.items(), key=lambda item: -item[1]):
+            share = seconds / self.wall_seconds * 100 if self.wall_seconds else 0
+            per_tick = seconds / self.ticks * 1e6 if self.ticks else 0
+            lines.append(f"  {name:<10} {seconds:8.3f} s {share:5.1f}% {per_tick:9.1f} us/tick")
+        return "\n".join(lines)
+
+
+class SimulationRunner:
+    """Advances `GameEngine.tick` as fast as the CPU allows, without rendering.
+
+    When the engine runs on a `VirtualClock`, the clock is advanced by `dt` each
+    tick, so the run is independent of wall-clock time.
+
+    Each system the engine drives is wrapped with a timer so the report breaks
+    tick cost down per system.
+    """
+
+    SYSTEMS = (
+        ("input", "input", "consume_events"),
+        ("settings", "settings", "update"),
+        ("place", "place_sys", "update"),
+        ("world", "world", "update"),
+        ("events", "event_bus", "clear"),
+    )
+
+    def __init__(self, engine: GameEngine, dt: float = DEFAULT_DT) -> None:
+        self.engine = engine
+        self.dt = dt
+        self._system_seconds: dict[str, float] = defaultdict(float)
+        for name, owner, method in self.SYSTEMS:
+            self._instrument(name, getattr(engine, owner), method)
+
+    def _instrument(self, name: str, owner: object, method: str) -> None:
+        original = getattr(owner, method)
+        system_seconds = self._system_seconds
+
+        def timed(*args: object, **kwargs: object) -> object:
+            start = time.perf_counter()
+            try:
+                return original(*args, **kwargs)
+            finally:
+                system_seconds[name] += time.perf_counter() - start
+
+        setattr(owner, method, timed)
+
+    def resume(self) -> None:
+        """Leave the main menu so the world gets updated."""
+        self.engine.event_bus.post(GameEvent(event_type=EventType.GAME_RESUMED, payload={}))
+
+    def spawn_zombies(self, count: int, seed: int | None = None) -> None:
+        """Add zombies on random walkable tiles, for scaling measurements."""
+        world = self.engine.world
+        rng = random.Random(seed)
+        tile_size = world.tile_map.tile_size
+        walkable = [idx for idx, cell in enumerate(world.navigation.walkable) if cell]
+        registry = world.zombies[0].sprite_registry if world.zombies else None
+        for i in range(count):
+            tile = rng.choice(walkable)
+            zombie = Zombie(
+                zombie_id=f"zombie_sim_{i}",
+                pos=Pos(
+                    x=(tile % world.tile_map.width) * tile_size,
+                    y=(tile // world.tile_map.width) * tile_size,
+                    z=2,
+                ),
+                behaviour=None,
+                sprite_registry=registry,
+            )
+            world.zombies.append(zombie)
+            world.add_entity(zombie)
+
+    def run(
+        self,
+        ticks: int | None = None,
+        until: Callable[[GameEngine], bool] | None = None,
+    ) -> SimulationReport:
+        """Run for `ticks` ticks or until `until(engine)` holds, whichever comes first."""
+        if ticks is None and until is None:
+            msg = "Either ticks or until must be given"
+            raise ValueError(msg)
+
+        self._system_seconds.clear()
+        engine = self.engine
+        ran = 0
+        start = time.perf_counter()
+        virtual_clock = engine.clock if isinstance(engine.clock, VirtualClock) else None
+        while (ticks is None or ran < ticks) and not (until and until(engine)):
+            if virtual_clock:
+                virtual_clock.advance(self.dt)
+            engine.tick(self.dt)
+            engine.event_bus.clear()
+            ran += 1
+        wall_seconds = time.perf_counter() - start
+
+        return SimulationReport(
+            ticks=ran,
+            simulated_seconds=ran * self.dt,
+            wall_seconds=wall_seconds,
+            system_seconds=dict(self._system_seconds),
+        )
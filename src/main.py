@@ -1,36 +1,75 @@
 # Import necessary JS bindings
+import asyncio
 import random
 
-from js import Event, document, performance, window
-from pyodide.ffi import create_proxy
-from pyodide.http import pyfetch
+from js import Event, document, window
 
 from engine import (
     Camera,
+    Clock,
     EventBus,
     GameEngine,
     InputSystem,
     RenderSystem,
     SoundSystem,
 )
+from engine.assets import (
+    AssetCache,
+    AssetLoader,
+    AssetManifest,
+    Assets,
+    BrowserAssetCache,
+    load_asset_versions,
+)
+from engine.frame_scheduler import FrameScheduler
 from engine.place import PlaceSystem
 from engine.settings import Settings
-from engine.state import DelayState
 from game import Fruit, Player, World, Zombie
 from game.inventory import Inventory
 from models import Pos, SpriteRegistry, TileMap, TilesRegistry
-from view import ViewBridge
+from startup import profiler
+from view import TileChunkCache, ViewBridge
 
 # ==== INITIAL SETUP ====
 
 PLAYER_Z = 2  # Player's z-index for rendering
 FRUIT_Z = 1
+# Seconds after the game loop starts before the puzzles and NumPy are loaded in the background
+PUZZLE_PRELOAD_DELAY = 5.0
+
+TILEMAP_DIR = "assets/tilemap/"
+TILEMAP_PATH = f"{TILEMAP_DIR}cj.tmb"  # compiled from cj.tmj by tools/build_map.py
+SPRITE_ATLAS_PATH = "assets/atlas/sprites.json"  # written by tools/build_atlas.py
+PLAYER_DB_PATH = "assets/db/player.json"
+ZOMBIE_DB_PATH = "assets/db/zombie.json"
+FRUIT_DB_PATH = "assets/db/fruit.json"
+BGM_PATH = "assets/audio/bgm.json"
+SFX_PATH = "assets/audio/sfx.json"
+
+# What the first frame needs besides the sprite atlas and the tile map, which are fetched
+# alongside it by `load_sprite_atlas` and `load_tile_map` together with the images they list
+ASSET_MANIFEST = AssetManifest(
+    json=(PLAYER_DB_PATH, ZOMBIE_DB_PATH, FRUIT_DB_PATH, BGM_PATH, SFX_PATH),
+)
+
+
+async def load_sprite_atlas(loader: AssetLoader) -> Assets:
+    """Fetch the sprite atlas manifest, then the atlas pages it lists."""
+    atlas = (await loader.load(AssetManifest(json=(SPRITE_ATLAS_PATH,)))).json[SPRITE_ATLAS_PATH]
+    return await loader.load(AssetManifest(json=(SPRITE_ATLAS_PATH,), images=tuple(atlas["images"])))
+
+
+async def load_tile_map(loader: AssetLoader) -> tuple[TileMap, Assets]:
+    """Fetch and load the map bundle, then fetch the tileset images it refers to."""
+    data = (await loader.load(AssetManifest(data=(TILEMAP_PATH,)))).data[TILEMAP_PATH]
+    with profiler.phase("tile map"):
+        tile_map = TileMap.load_from_bundle(data)
+    tileset_images = tuple(f"{TILEMAP_DIR}{tileset['image']}" for tileset in tile_map.tilesets)
+    return tile_map, await loader.load(AssetManifest(images=tileset_images))
 
 
-async def create_player(tile_map: TileMap) -> Player:
+def create_player(tile_map: TileMap, player_sprite_registry: SpriteRegistry) -> Player:
     """Add a player to the world at the center position."""
-    player_sprite_registry_json = await load_json("assets/db/player.json")
-    player_sprite_registry = SpriteRegistry.load_from_json(player_sprite_registry_json)
     player_x, player_y = tile_map.player_spawn
 
     return Player(
@@ -43,10 +82,8 @@ async def create_player(tile_map: TileMap) -> Player:
     )
 
 
-async def create_zombies(tile_map: TileMap) -> list[Zombie]:
+def create_zombies(tile_map: TileMap, zombie_sprite_registry: SpriteRegistry) -> list[Zombie]:
     """Add a zombie to the world at the center position."""
-    zombie_sprite_registry_json = await load_json("assets/db/zombie.json")
-    zombie_sprite_registry = SpriteRegistry.load_from_json(zombie_sprite_registry_json)
     zombies = []
     zombie_spawn_positions = set(tile_map.zombie_spawns)
     for i, spawn in enumerate(zombie_spawn_positions):
@@ -66,10 +103,8 @@ async def create_zombies(tile_map: TileMap) -> list[Zombie]:
     return zombies
 
 
-async def create_fruits(tile_map: TileMap, num_fruits: int = 5) -> list[Fruit]:
+def create_fruits(tile_map: TileMap, fruit_registry: SpriteRegistry, num_fruits: int = 5) -> list[Fruit]:
     """Add a specified number of fruits to the world at random positions."""
-    fruit_registry_json = await load_json("assets/db/fruit.json")
-    fruit_registry = SpriteRegistry.load_from_json(fruit_registry_json)
     fruits = []
     fruit_positions = set(tile_map.fruit_spawns)
     for i in range(num_fruits):
@@ -95,30 +130,55 @@ async def create_fruits(tile_map: TileMap, num_fruits: int = 5) -> list[Fruit]:
     return fruits
 
 
-async def create_engine() -> GameEngine:
-    """Create and return the game engine."""
+async def create_engine(clock: Clock | None = None, asset_cache: AssetCache | None = None) -> GameEngine:
+    """Create and return the game engine, running on `clock` or real time by default.
+
+    Assets are kept in `asset_cache` between runs, the browser's Cache API by default.
+    """
     # Ensure all systems are initialized
     canvas = document.getElementById("gameCanvas")
     canvas.width = window.innerWidth
     canvas.height = window.innerHeight
     input_sys = InputSystem()
 
-    tiled = await load_json("assets/tilemap/cj.tmj")
-
-    tile_registry = TilesRegistry.load_from_tiled(
-        directory="assets/tilemap/",
-        tiled=tiled,
-    )
-
-    tile_map = TileMap.load_from_tiled(tiled)
+    with profiler.phase("load assets"):
+        loader = AssetLoader(
+            on_progress=report_progress,
+            cache=asset_cache if asset_cache is not None else BrowserAssetCache(),
+            versions=await load_asset_versions(),
+        )
+        assets, atlas_assets, (tile_map, tileset_assets) = await asyncio.gather(
+            loader.load(ASSET_MANIFEST),
+            load_sprite_atlas(loader),
+            load_tile_map(loader),
+        )
+    print(f"Loaded {loader.total} assets, {loader.cache_hits} from the cache")
+    atlas = atlas_assets.json[SPRITE_ATLAS_PATH]
+    bgm_map = assets.json[BGM_PATH]
+    sfx_map = assets.json[SFX_PATH]
+    # not needed for the first frame, buffered while the game starts
+    loader.preload_audio(sound["path"] for sound in (*bgm_map.values(), *sfx_map.values()))
+
+    with profiler.phase("tile registry"):
+        tile_registry = TilesRegistry.load_from_tilesets(
+            directory=TILEMAP_DIR,
+            tilesets=tile_map.tilesets,
+            images=tileset_assets.images,
+        )
 
     world_width_pixels = tile_map.width * tile_map.tile_size
     world_height_pixels = tile_map.height * tile_map.tile_size
 
-    player = await create_player(tile_map)
-    fruits = await create_fruits(tile_map, num_fruits=5)
-    zombies = await create_zombies(tile_map)
-    world = World(player, fruits, zombies, tile_map=tile_map, inventory=Inventory())
+    with profiler.phase("sprite registries"):
+        fruit_registry = SpriteRegistry.load_from_json(assets.json[FRUIT_DB_PATH], atlas)
+        player_registry = SpriteRegistry.load_from_json(assets.json[PLAYER_DB_PATH], atlas)
+        zombie_registry = SpriteRegistry.load_from_json(assets.json[ZOMBIE_DB_PATH], atlas)
+
+    with profiler.phase("world"):
+        player = create_player(tile_map, player_registry)
+        fruits = create_fruits(tile_map, fruit_registry, num_fruits=5)
+        zombies = create_zombies(tile_map, zombie_registry)
+        world = World(player, fruits, zombies, tile_map=tile_map, inventory=Inventory())
 
     camera = Camera(
         x=2,
@@ -131,24 +191,28 @@ async def create_engine() -> GameEngine:
     )
 
     sound_sys = SoundSystem(
-        bgm_map=await load_json("assets/audio/bgm.json"),
-        sfx_map=await load_json("assets/audio/sfx.json"),
+        bgm_map=bgm_map,
+        sfx_map=sfx_map,
     )
 
-    view_bridge = ViewBridge(canvas, input_sys, tile_registry)
-    render_system = RenderSystem(view_bridge=view_bridge, camera=camera, inventory_overlay=world.inventory_ui)
+    with profiler.phase("renderer"):
+        chunk_cache = TileChunkCache(tile_map, tile_registry)
+        view_bridge = ViewBridge(canvas, input_sys, tile_registry, chunk_cache=chunk_cache)
+        view_bridge.add_images(atlas_assets.images)
+        render_system = RenderSystem(view_bridge=view_bridge, camera=camera, inventory_overlay=world.inventory_ui)
     event_bus = EventBus()
 
-    settings = Settings(
-        event_bus=event_bus,
-        sound_system=sound_sys,
-    )
+    with profiler.phase("menus"):
+        settings = Settings(
+            event_bus=event_bus,
+            sound_system=sound_sys,
+        )
 
     place_sys = PlaceSystem(
         input_sys=input_sys,
         event_bus=event_bus,
         tile_map=tile_map,
-        fruit_registry=SpriteRegistry.load_from_json(await load_json("assets/db/fruit.json")),
+        fruit_registry=fruit_registry,
         world=world,
     )
 
@@ -160,6 +224,7 @@ async def create_engine() -> GameEngine:
         sound_sys=sound_sys,
         settings=settings,
         place_sys=place_sys,
+        clock=clock,
     )
 
 
@@ -175,40 +240,30 @@ def on_resize(engine: GameEngine) -> None:
 
 
 # ==== GAME LOOP ====
-def tick_frame(engine: GameEngine, timestamp: float, lf_timestamp: float = 0) -> None:
+def tick_frame(engine: GameEngine) -> None:
     """Update and render the game in the main loop."""
-    dt = 1 / 60  # fixed timestep for now
-
-    engine.tick(dt)
+    # Run the simulation steps due since the last frame, the event bus is cleared after each
+    engine.update()
 
     # Handle Camera
     player = engine.world.get_current_player()
-    engine.renderer.camera.center_on(player.pos)
+    engine.renderer.camera.center_on(player.interpolated_pos(engine.alpha))
 
     # Render
-    engine.render(timestamp - DelayState.get_delay())
+    engine.render()
 
-    # Clear the event bus after processing
-    engine.event_bus.clear()
 
-    if engine.settings.game_state.is_paused():
-        DelayState.accum_delay(timestamp - lf_timestamp)
-
-    # Schedule next frame
-    window.requestAnimationFrame(
-        create_proxy(
-            lambda _: tick_frame(
-                engine=engine,
-                timestamp=performance.now(),
-                lf_timestamp=timestamp,
-            ),
-        ),
-    )
+def run_game_loop(engine: GameEngine) -> FrameScheduler:
+    """Run `tick_frame` on every animation frame, through one long-lived proxy."""
+    engine.frame_scheduler = FrameScheduler(lambda _timestamp: tick_frame(engine=engine))
+    engine.frame_scheduler.start()
+    return engine.frame_scheduler
 
 
 async def start() -> None:
     """Initialize the game engine and start the game loop."""
-    engine = await create_engine()
+    with profiler.phase("create engine"):
+        engine = await create_engine()
 
     engine.settings.main_menu.make_visible()
 
@@ -216,11 +271,21 @@ async def start() -> None:
         """Handle window resize events."""
         on_resize(engine)
 
-    window.addEventListener("resize", create_proxy(handle_resize))
+    engine.add_listener(window, ("resize",), handle_resize)
+
+    def handle_pagehide(event: Event) -> None:
+        """Release the engine's browser callbacks when the page is unloaded."""
+        # a page kept in the back/forward cache may be shown again, with the game still running
+        if not event.persisted:
+            engine.teardown()
+
+    engine.add_listener(window, ("pagehide",), handle_pagehide)
 
-    tick_frame(engine=engine, timestamp=0)
+    run_game_loop(engine)
+    profiler.finish()
+    engine.renderer.puzzle_loader.preload(PUZZLE_PRELOAD_DELAY)
 
 
-async def load_json(path: str) -> dict:
-    res = await pyfetch(path)
-    return await res.json()
+def report_progress(loaded: int, total: int, path: str) -> None:
+    """Log asset loading progress to the console."""
+    print(f"Loaded {path} ({loaded}/{total})")
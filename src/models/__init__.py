@@ -1,3 +1,4 @@
+from .collision import CollisionGrid
 from .direction import Direction
 from .draw_cmd import DrawCmd
 from .position import Pos
@@ -5,6 +6,7 @@ from .sprite import Sprite, SpriteRegistry
 from .tile import Tile, TileMap, Tileset, TilesRegistry
 
 __all__ = [
+    "CollisionGrid",
     "Direction",
     "DrawCmd",
     "Pos",
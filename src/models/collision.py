@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import math
+from array import array
+from itertools import accumulate
+from operator import add
+
+# Side length of a collision cell in world pixels. Collision boxes are rasterized
+# conservatively, so a box may block up to this many extra pixels around its edges.
+COLLISION_RESOLUTION = 8
+
+
+class CollisionGrid:
+    """Passability bitmap rasterized from the Tiled collision objects.
+
+    The world is split into ``resolution`` x ``resolution`` pixel cells and a cell is
+    blocked when any non-passable collision box overlaps it. A summed-area table over
+    the cells makes area queries constant time, whatever the size of the queried
+    rectangle or the number of collision boxes in the map.
+    """
+
+    def __init__(self, width: int, height: int, resolution: int = COLLISION_RESOLUTION) -> None:
+        self.width = width  # in world pixels
+        self.height = height  # in world pixels
+        self.resolution = resolution
+        self.cols = math.ceil(width / resolution)
+        self.rows = math.ceil(height / resolution)
+        self.cells = bytearray(self.cols * self.rows)
+        # sums[(row) * (cols + 1) + col] = blocked cells above and left of (col, row)
+        self._sums = array("I", bytes(4 * (self.cols + 1) * (self.rows + 1)))
+        self._dirty = False
+
+    def _cell_span(self, x: float, y: float, width: float, height: float) -> tuple[int, int, int, int] | None:
+        """Return the inclusive range of cells overlapped by an open rectangle, clipped to the grid."""
+        res = self.resolution
+        col0 = max(math.floor(x / res), 0)
+        row0 = max(math.floor(y / res), 0)
+        col1 = min(math.ceil((x + width) / res) - 1, self.cols - 1)
+        row1 = min(math.ceil((y + height) / res) - 1, self.rows - 1)
+        if col0 > col1 or row0 > row1:
+            return None
+        return col0, row0, col1, row1
+
+    def block_rect(self, x: float, y: float, width: float, height: float) -> None:
+        """Mark every cell overlapped by the rectangle as blocked."""
+        span = self._cell_span(x, y, width, height)
+        if span is None:
+            return
+        col0, row0, col1, row1 = span
+        blocked = b"\x01" * (col1 - col0 + 1)
+        for row in range(row0, row1 + 1):
+            start = row * self.cols + col0
+            self.cells[start : start + len(blocked)] = blocked
+        self._dirty = True
+
+    def pack(self) -> bytes:
+        """Return the cells, one byte each, for `unpack`.
+
+        The summed-area table is left out, it is several times larger than the
+        cells and is rebuilt from them before the first area query.
+        """
+        return bytes(self.cells)
+
+    def unpack(self, data: memoryview) -> None:
+        """Restore the cells written by `pack` for a grid of the same size."""
+        self.cells[:] = data[: len(self.cells)]
+        self._dirty = True
+
+    def _rebuild_sums(self) -> None:
+        # row by row: the running sums of a row of cells added to the sums of the row above
+        cols = self.cols
+        cells = self.cells
+        above = array("I", bytes(4 * (cols + 1)))
+        sums = array("I", above)
+        for start in range(0, self.rows * cols, cols):
+            above = array("I", map(add, above, accumulate(cells[start : start + cols], initial=0)))
+            sums.extend(above)
+        self._sums = sums
+        self._dirty = False
+
+    def is_blocked(self, x: float, y: float) -> bool:
+        """Check if the cell containing a world point is blocked."""
+        col = int(x // self.resolution)
+        row = int(y // self.resolution)
+        if not (0 <= col < self.cols and 0 <= row < self.rows):
+            return False
+        return bool(self.cells[row * self.cols + col])
+
+    def is_area_free(self, x: float, y: float, width: float, height: float) -> bool:
+        """Check that no blocked cell overlaps the given world rectangle."""
+        span = self._cell_span(x, y, width, height)
+        if span is None:
+            return True
+        if self._dirty:
+            self._rebuild_sums()
+        col0, row0, col1, row1 = span
+        stride = self.cols + 1
+        sums = self._sums
+        top = row0 * stride
+        bottom = (row1 + 1) * stride
+        blocked = sums[bottom + col1 + 1] - sums[top + col1 + 1] - sums[bottom + col0] + sums[top + col0]
+        return blocked == 0
@@ -1,23 +1,30 @@
 from dataclasses import dataclass
 from enum import Enum
+from operator import attrgetter
 from typing import TYPE_CHECKING, Optional
 
-from puzzles import SlidingTilesPuzzle
 from ui.inventory import InventoryOverlay
 
+from .position import Pos
+
 if TYPE_CHECKING:
     from models import ObjectTile
+    from puzzles.sliding_tiles_puzzle import SlidingTilesPuzzle
     from ui import DialogBox
 
-    from .position import Pos
     from .sprite import Sprite
 
 
+# Texture id of draws that use no source image, they sort after the textured draws of their layer
+UNTEXTURED = 1 << 30
+
+
 class DrawCmdType(Enum):
     """Types of draw commands for the RenderSystem."""
 
     SPRITE = "sprite"
     TILE = "tile"
+    CHUNK = "chunk"
     COLLISION = "collision"
     TEXT = "text"
     DIALOG = "dialog"
@@ -25,7 +32,7 @@ class DrawCmdType(Enum):
     PUZZLE = "puzzle"
 
 
-@dataclass
+@dataclass(slots=True)
 class DrawCmd:
     """Represents a single draw instruction for the RenderSystem.
 
@@ -38,11 +45,143 @@ class DrawCmd:
     frame_idx: int = 0
     dialog: Optional["DialogBox"] = None
     tile_gid: int = 0  # For tile rendering
+    chunk: tuple[int, int] | None = None  # For pre-rendered tile chunk rendering
     collision_box: Optional["ObjectTile"] = None
     inventory_overlay: InventoryOverlay | None = None
     text: str | None = None
     layer: int = 0  # Rendering order (higher = drawn later, on top)
+    sublayer: int = 0  # Rendering order within a layer, e.g. the Tiled layer index of a tile
     rotation: float = 0.0  # Rotation in degrees
     scale: float = 1.0  # Scale multiplier
     opacity: float = 1.0  # Transparency (1.0 = fully opaque)
-    puzzle: SlidingTilesPuzzle | None = None
+    puzzle: Optional["SlidingTilesPuzzle"] = None
+    texture: int = UNTEXTURED  # Id of the source image, draws are batched by it
+
+
+class DrawCmdPool:
+    """Recycles `DrawCmd` records, and their positions, from one frame to the next.
+
+    `reset` at the start of a frame makes every record available again, so a
+    steady scene allocates no new commands.
+    """
+
+    def __init__(self) -> None:
+        self._cmds: list[DrawCmd] = []
+        self._used = 0
+
+    def __len__(self) -> int:
+        return self._used
+
+    def reset(self) -> None:
+        """Release every command handed out since the last reset."""
+        self._used = 0
+
+    def acquire(
+        self,
+        cmd_type: DrawCmdType,
+        x: float,
+        y: float,
+        z: int = 0,
+        layer: int = 0,
+        sublayer: int = 0,
+        scale: float = 1.0,
+        sprite: Optional["Sprite"] = None,
+        frame_idx: int = 0,
+        tile_gid: int = 0,
+        chunk: tuple[int, int] | None = None,
+        collision_box: Optional["ObjectTile"] = None,
+        dialog: Optional["DialogBox"] = None,
+        inventory_overlay: InventoryOverlay | None = None,
+        puzzle: Optional["SlidingTilesPuzzle"] = None,
+        texture: int = UNTEXTURED,
+        text: str | None = None,
+    ) -> DrawCmd:
+        """Return a command set up with the given fields, the others at their defaults."""
+        if self._used < len(self._cmds):
+            cmd = self._cmds[self._used]
+            position = cmd.position
+            position.x = x
+            position.y = y
+            position.z = z
+        else:
+            cmd = DrawCmd(position=Pos(x, y, z))
+            self._cmds.append(cmd)
+        self._used += 1
+
+        cmd.type = cmd_type
+        cmd.layer = layer
+        cmd.sublayer = sublayer
+        cmd.scale = scale
+        cmd.sprite = sprite
+        cmd.frame_idx = frame_idx
+        cmd.tile_gid = tile_gid
+        cmd.chunk = chunk
+        cmd.collision_box = collision_box
+        cmd.dialog = dialog
+        cmd.inventory_overlay = inventory_overlay
+        cmd.puzzle = puzzle
+        cmd.texture = texture
+        cmd.text = text
+        cmd.rotation = 0.0
+        cmd.opacity = 1.0
+        return cmd
+
+
+@dataclass(slots=True)
+class BatchStats:
+    """Draw batching of the last frame, see `LayerBuckets.drain_into`."""
+
+    draws: int = 0  # textured draws
+    batches: int = 0  # runs of consecutive draws from the same source image
+
+
+_batch_order = attrgetter("sublayer", "texture", "position.y")
+
+
+class LayerBuckets:
+    """Groups draw commands by layer, replacing a sort of the whole frame.
+
+    Within a layer, commands are ordered by sublayer, so that the tile layers of
+    a Tiled map stack in their order, then by source image and screen y, so
+    that consecutive draws from the same image form one batch.
+    """
+
+    def __init__(self) -> None:
+        self._buckets: dict[int, list[DrawCmd]] = {}
+        self.stats = BatchStats()
+
+    def add(self, cmd: DrawCmd) -> None:
+        """Queue `cmd` in its layer."""
+        bucket = self._buckets.get(cmd.layer)
+        if bucket is None:
+            bucket = self._buckets[cmd.layer] = []
+        bucket.append(cmd)
+
+    def clear(self) -> None:
+        """Empty every layer, keeping the lists for the next frame."""
+        for bucket in self._buckets.values():
+            bucket.clear()
+
+    def drain_into(self, draw_commands: list[DrawCmd]) -> None:
+        """Append the queued commands to `draw_commands`, lowest layer first, and clear.
+
+        Also updates `stats` with the number of draws and batches.
+        """
+        draws = batches = 0
+        last_texture = UNTEXTURED
+        for layer in sorted(self._buckets):
+            bucket = self._buckets[layer]
+            bucket.sort(key=_batch_order)
+            for cmd in bucket:
+                if cmd.texture == UNTEXTURED:
+                    # drawn without an image, ends the current batch
+                    last_texture = UNTEXTURED
+                    continue
+                draws += 1
+                if cmd.texture != last_texture:
+                    batches += 1
+                    last_texture = cmd.texture
+            draw_commands.extend(bucket)
+        self.stats.draws = draws
+        self.stats.batches = batches
+        self.clear()
@@ -19,11 +19,24 @@ class Sprite(Drawable):
     origin: tuple[int, int] = (0, 0)  # Pivot/origin for rotation/scaling
     tint: tuple[int, int, int] | None = None  # RGB color tint (if any)
     loop: bool = False
+    frames: tuple[tuple[int, int, int, int], ...] = ()  # (x, y, width, height) source rects, from an atlas
 
     def is_animated(self) -> bool:
         """Return True if sprite has more than one frame."""
         return self.loop
 
+    def frame_rect(self, frame_idx: int) -> tuple[int, int, int, int] | None:
+        """Return the source rect of a frame, or None to draw the whole image.
+
+        Atlas sprites use their named rects, others fall back to a strip of `size` wide frames.
+        """
+        if self.frames:
+            return self.frames[frame_idx % len(self.frames)]
+        if self.is_animated():
+            w, h = self.size
+            return (frame_idx * w, 0, w, h)
+        return None
+
     def draw(
         self,
         canvas: HTMLCanvasElement,
@@ -39,15 +52,11 @@ class Sprite(Drawable):
         ctx.translate(x + w / 2, y + h / 2)
         ctx.rotate(cmd.rotation * (Math.PI / 180))
 
-        if self.is_animated():
-            source_x = cmd.frame_idx * w
-            source_y = 0
+        rect = self.frame_rect(cmd.frame_idx)
+        if rect is not None:
             ctx.drawImage(
                 img,
-                source_x,
-                source_y,
-                w,
-                h,
+                *rect,
                 -w / 2,
                 -h / 2,
                 w * cmd.scale,
@@ -73,15 +82,30 @@ class SpriteRegistry:
         self._sprites[state] = sprite
 
     @classmethod
-    def load_from_json(cls, data: dict) -> "SpriteRegistry":
-        """Load sprite metadata from a JSON file."""
+    def load_from_json(cls, data: dict, atlas: dict | None = None) -> "SpriteRegistry":
+        """Load sprite metadata from a JSON file.
+
+        With an `atlas` manifest from `tools/build_atlas.py`, every state is drawn
+        from the atlas image by its frame rects instead of from its own sheet. A
+        state the atlas lacks raises ValueError: the atlas is stale and must be
+        rebuilt, as drawing the whole atlas image in its place would be garbage.
+        """
         sprite_registry = cls()
+        packed = atlas["sprites"].get(data["name"], {}) if atlas else {}
         for state, info in data["state"].items():
+            image_path, frames = info["image_path"], ()
+            if atlas:
+                if not packed.get(state, {}).get("frames"):
+                    msg = f"Sprite {data['name']} state {state} has no frames in the atlas, rebuild it"
+                    raise ValueError(msg)
+                image_path = atlas["images"][packed[state]["image"]]
+                frames = tuple(tuple(rect) for rect in packed[state]["frames"])
             sprite = Sprite(
-                image_path=info["image_path"],
+                image_path=image_path,
                 size=(info["width"], info["height"]),
                 frame_count=info["frame_count"],
                 loop=info.get("loop", False),
+                frames=frames,
             )
             sprite_registry.add(state, sprite)
 
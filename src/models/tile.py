@@ -1,9 +1,36 @@
-from collections import defaultdict
-from dataclasses import dataclass
+from __future__ import annotations
 
-from js import HTMLCanvasElement, Image
+import json
+import struct
+import sys
+from array import array
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
 
-from models import DrawCmd
+from js import Image
+
+from models.collision import CollisionGrid
+
+if TYPE_CHECKING:
+    from js import CanvasRenderingContext2D, HTMLCanvasElement
+
+    from models import DrawCmd
+
+CELL_OCCUPIED = 0b01  # at least one layer has a tile at this cell
+CELL_BLOCKED = 0b10  # at least one tile at this cell is not passable
+
+BOX_INDEX_CELL_TILES = 8  # side of a collision box index cell, in tiles
+
+# Tileset fields read from Tiled maps and kept in map bundles
+TILESET_KEYS = ("name", "image", "firstgid", "columns", "tilewidth", "tileheight", "tilecount")
+
+# Map bundles, compiled from Tiled maps by tools/build_map.py, are little-endian:
+# the header, a JSON metadata block padded to 4 bytes, the uint32 gids of every layer,
+# the cell flags, then the packed collision grid.
+BUNDLE_MAGIC = b"SSTM"
+BUNDLE_VERSION = 2
+# magic, version, width, height, tile size, layer count, metadata size
+BUNDLE_HEADER = struct.Struct("<4sIIIIII")
 
 
 @dataclass
@@ -19,19 +46,62 @@ class Tileset:
     tilecount: int
 
 
+# (tileset image, source x, source y, width, height) of a single gid
+TileRect = tuple[Image, int, int, int, int]
+
+
 @dataclass
 class TilesRegistry:
-    """Registry for managing multiple tilesets."""
+    """Registry for managing multiple tilesets.
+
+    ``tile_rects`` is a flat lookup table indexed by gid, built once from the
+    tilesets, so drawing a tile never has to search the tilesets.
+    """
 
     tilesets: list[Tileset] = None
+    tile_rects: list[TileRect | None] = field(init=False, repr=False)
+    _ctx_canvas: HTMLCanvasElement | None = field(init=False, default=None, repr=False)
+    _ctx: CanvasRenderingContext2D | None = field(init=False, default=None, repr=False)
+
+    def __post_init__(self) -> None:
+        self.tile_rects = self._build_tile_rects(self.tilesets or [])
+
+    @staticmethod
+    def _build_tile_rects(tilesets: list[Tileset]) -> list[TileRect | None]:
+        """Precompute the source rect of every gid covered by the tilesets."""
+        max_gid = max((ts.firstgid + ts.tilecount for ts in tilesets), default=0)
+        tile_rects: list[TileRect | None] = [None] * max_gid
+        for tileset in tilesets:
+            for tile_index in range(tileset.tilecount):
+                tile_rects[tileset.firstgid + tile_index] = (
+                    tileset.image,
+                    (tile_index % tileset.columns) * tileset.tilewidth,
+                    (tile_index // tileset.columns) * tileset.tileheight,
+                    tileset.tilewidth,
+                    tileset.tileheight,
+                )
+        return tile_rects
+
+    @classmethod
+    def load_from_tiled(cls, directory: str, tiled: dict, images: dict[str, Image] | None = None) -> TilesRegistry:
+        """Load tilesets from a Tiled JSON object, using the already loaded `images` by path."""
+        return cls.load_from_tilesets(directory, tiled["tilesets"], images)
 
     @classmethod
-    def load_from_tiled(cls, directory: str, tiled: dict) -> "TilesRegistry":
-        """Load tilesets from a Tiled JSON object."""
+    def load_from_tilesets(
+        cls,
+        directory: str,
+        tilesets: list[dict],
+        images: dict[str, Image] | None = None,
+    ) -> TilesRegistry:
+        """Load Tiled tileset definitions, using the already loaded `images` by path."""
         result = []
-        for ts in tiled["tilesets"]:
-            image = Image.new()
-            image.src = f"{directory}{ts['image']}"
+        for ts in tilesets:
+            path = f"{directory}{ts['image']}"
+            image = images.get(path) if images else None
+            if image is None:
+                image = Image.new()
+                image.src = path
             tileset = Tileset(
                 name=ts["name"],
                 image=image,
@@ -45,34 +115,47 @@ class TilesRegistry:
 
         return cls(tilesets=result)
 
+    def is_loaded(self) -> bool:
+        """Check if every tileset image has finished loading."""
+        return all(ts.image.complete and ts.image.naturalWidth > 0 for ts in self.tilesets)
+
+    def get_rect(self, gid: int) -> TileRect | None:
+        """Get the tileset image and source rect for a gid."""
+        return self.tile_rects[gid] if 0 <= gid < len(self.tile_rects) else None
+
+    def context(self, canvas: HTMLCanvasElement) -> CanvasRenderingContext2D:
+        """Return the 2d context of a canvas, reusing it while the canvas stays the same."""
+        if canvas is not self._ctx_canvas:
+            self._ctx_canvas = canvas
+            self._ctx = canvas.getContext("2d", alpha=True)
+        return self._ctx
+
     def draw_tile(
         self,
         canvas: HTMLCanvasElement,
         cmd: DrawCmd,
     ) -> None:
         """Draw a tile at the specified position."""
-        gid = cmd.tile_gid
-        position = cmd.position
-        scale = cmd.scale
-        for tileset in self.tilesets:
-            if tileset.firstgid <= gid < tileset.firstgid + tileset.tilecount:
-                tile_index = gid - tileset.firstgid
-                x = (tile_index % tileset.columns) * tileset.tilewidth
-                y = (tile_index // tileset.columns) * tileset.tileheight
-
-                ctx = canvas.getContext("2d", alpha=True)
-                ctx.drawImage(
-                    tileset.image,
-                    x,
-                    y,
-                    tileset.tilewidth,
-                    tileset.tileheight,
-                    position.x,
-                    position.y,
-                    tileset.tilewidth * scale,
-                    tileset.tileheight * scale,
-                )
-                break
+        self.blit(self.context(canvas), cmd.tile_gid, cmd.position.x, cmd.position.y, cmd.scale)
+
+    def blit(self, ctx: CanvasRenderingContext2D, gid: int, x: float, y: float, scale: float) -> None:
+        """Draw a single tile through an already acquired 2d context."""
+        rect = self.get_rect(gid)
+        if rect is None:
+            return
+
+        image, source_x, source_y, width, height = rect
+        ctx.drawImage(
+            image,
+            source_x,
+            source_y,
+            width,
+            height,
+            x,
+            y,
+            width * scale,
+            height * scale,
+        )
 
 
 @dataclass
@@ -97,56 +180,157 @@ class ObjectTile:
 
 
 class TileMap:
-    """Grid of tiles that makes up the world terrain."""
+    """Grid of tiles that makes up the world terrain.
+
+    Tiles are stored densely: ``gids`` is a flat ``(layers, height, width)`` array of
+    global tile ids (0 = empty) and ``flags`` holds one byte per cell with the
+    ``CELL_OCCUPIED`` / ``CELL_BLOCKED`` bits used for passability queries.
+    """
 
-    def __init__(self, width: int, height: int, tile_size: int) -> None:
+    def __init__(self, width: int, height: int, tile_size: int, layers: int = 1) -> None:
         self.width = width
         self.height = height
         self.tile_size = tile_size
-        self.tiles: dict[tuple[int, int], list[Tile]] = defaultdict(list)
+        self.layers = 0
+        self.gids: array[int] = array("I")
+        self.layer_z: list[int] = []
+        self.flags = bytearray(width * height)
+        # offsets in ``gids`` of the tiles that are not passable, CELL_BLOCKED is derived from them
+        self.blocked_tiles: set[int] = set()
         self.collision_boxes: list[ObjectTile] = []
+        # collision boxes by the index cells they overlap, for rectangle queries
+        self._box_cells: dict[tuple[int, int], list[ObjectTile]] = {}
+        self.collision_grid = CollisionGrid(width * tile_size, height * tile_size)
         self.player_spawn: tuple[int, int] = (0, 0)
         self.zombie_spawns: list[tuple[int, int]] = []
         self.altars: list[tuple[int, int]] = []
         self.puzzle: tuple[int, int] = (0, 0)
         self.fruit_spawns: list[tuple[int, int]] = []
+        # Tiled tileset definitions the gids refer to, see TILESET_KEYS
+        self.tilesets: list[dict] = []
+        for _ in range(layers):
+            self.add_layer()
+
+    def add_layer(self, z: int = 0) -> int:
+        """Append an empty tile layer and return its index."""
+        self.gids.frombytes(bytes(self.gids.itemsize * self.width * self.height))
+        self.layer_z.append(z)
+        self.layers += 1
+        return self.layers - 1
+
+    def index(self, layer: int, x: int, y: int) -> int:
+        """Return the offset of a cell of a layer in ``gids``."""
+        return (layer * self.height + y) * self.width + x
+
+    def in_bounds(self, x: int, y: int) -> bool:
+        """Check if the given tile coordinates are inside the map."""
+        return 0 <= x < self.width and 0 <= y < self.height
+
+    def gid_at(self, layer: int, x: int, y: int) -> int:
+        """Get the gid of a single layer at given coordinates (0 if empty)."""
+        return self.gids[self.index(layer, x, y)]
 
     def get(self, x: int, y: int) -> list[Tile] | None:
         """Get the tile at given coordinates."""
-        return self.tiles.get((x, y), None)
+        # callers pass `world_pos // tile_size`, which is a float for float positions
+        x, y = int(x), int(y)
+        if not self.in_bounds(x, y) or not self.flags[y * self.width + x] & CELL_OCCUPIED:
+            return None
+        tiles = []
+        for layer in range(self.layers):
+            offset = self.index(layer, x, y)
+            gid = self.gids[offset]
+            if gid:
+                tiles.append(Tile(gid=gid, z=self.layer_z[layer], passable=offset not in self.blocked_tiles))
+        return tiles
+
+    def set(self, x: int, y: int, tile: Tile, layer: int | None = None) -> None:
+        """Set the tile at given coordinates.
+
+        Without an explicit ``layer`` the tile is stacked on the first layer that is
+        still empty at this cell, adding a new layer if needed.
+        """
+        if not self.in_bounds(x, y):
+            return
+        if layer is None:
+            layer = next(
+                (i for i in range(self.layers) if not self.gids[self.index(i, x, y)]),
+                None,
+            )
+            if layer is None:
+                layer = self.add_layer(tile.z)
+        while layer >= self.layers:
+            self.add_layer(tile.z)
+        offset = self.index(layer, x, y)
+        self.gids[offset] = tile.gid
+        self.layer_z[layer] = tile.z
+        if tile.passable or not tile.gid:
+            self.blocked_tiles.discard(offset)
+        else:
+            self.blocked_tiles.add(offset)
 
-    def set(self, x: int, y: int, tile: Tile) -> None:
-        """Set the tile at given coordinates."""
-        if 0 <= x < self.width and 0 <= y < self.height:
-            self.tiles[(x, y)].append(tile)
+        # recomputed from every layer, the replaced tile may have been the only one set or blocking
+        flags = 0
+        for layer_offset in range(self.index(0, x, y), len(self.gids), self.width * self.height):
+            if self.gids[layer_offset]:
+                flags |= CELL_OCCUPIED
+            if layer_offset in self.blocked_tiles:
+                flags |= CELL_BLOCKED
+        self.flags[y * self.width + x] = flags
 
     def is_passable(self, x: int, y: int) -> bool:
         """Check if a tile can be walked on."""
-        tile = self.get(x, y)
-        return tile is not None and all(t.passable for t in tile)
+        x, y = int(x), int(y)
+        return self.in_bounds(x, y) and self.flags[y * self.width + x] == CELL_OCCUPIED
 
     def add_collision_box(self, obj: ObjectTile) -> None:
         """Add a collision box to the tile map."""
+        if not obj.passable:
+            self.collision_grid.block_rect(obj.x, obj.y, obj.width, obj.height)
+        self._index_collision_box(obj)
+
+    def _index_collision_box(self, obj: ObjectTile) -> None:
+        """Add a collision box to the box list and index, without rasterizing it."""
         self.collision_boxes.append(obj)
+        cell_size = self.tile_size * BOX_INDEX_CELL_TILES
+        for row in range(int(obj.y // cell_size), int((obj.y + obj.height) // cell_size) + 1):
+            for col in range(int(obj.x // cell_size), int((obj.x + obj.width) // cell_size) + 1):
+                self._box_cells.setdefault((col, row), []).append(obj)
+
+    def collision_boxes_in_rect(self, x0: float, y0: float, x1: float, y1: float) -> list[ObjectTile]:
+        """Return the collision boxes overlapping the world pixel rectangle (x0, y0)-(x1, y1)."""
+        cell_size = self.tile_size * BOX_INDEX_CELL_TILES
+        found: dict[int, ObjectTile] = {}
+        for row in range(int(y0 // cell_size), int(y1 // cell_size) + 1):
+            for col in range(int(x0 // cell_size), int(x1 // cell_size) + 1):
+                for box in self._box_cells.get((col, row), ()):
+                    if box.x < x1 and box.x + box.width > x0 and box.y < y1 and box.y + box.height > y0:
+                        found[id(box)] = box
+        return list(found.values())
 
     @classmethod
-    def load_from_tiled(cls, tiled: dict) -> "TileMap":
+    def load_from_tiled(cls, tiled: dict) -> TileMap:
         """Load tile map data from a Tiled JSON object."""
+        tile_layers = [layer for layer in tiled["layers"] if layer["type"] == "tilelayer"]
         tile_map = cls(
             width=tiled["width"],
             height=tiled["height"],
             tile_size=tiled["tilewidth"],
+            layers=len(tile_layers),
         )
+        tile_map.tilesets = [{key: ts[key] for key in TILESET_KEYS} for ts in tiled["tilesets"]]
+
+        cells = tile_map.width * tile_map.height
+        for layer_idx, layer in enumerate(tile_layers):
+            # Tiled stores layers row-major, exactly like a single layer of `gids`
+            offset = layer_idx * cells
+            tile_map.gids[offset : offset + cells] = array("I", layer["data"])
+            for cell, gid in enumerate(layer["data"]):
+                if gid > 0:
+                    tile_map.flags[cell] |= CELL_OCCUPIED
 
         for layer in tiled["layers"]:
-            if layer["type"] == "tilelayer":
-                for idx, gid in enumerate(layer["data"]):
-                    if gid > 0:
-                        x = idx % tile_map.width
-                        y = idx // tile_map.width
-                        tile = Tile(gid=gid, z=0, passable=True)
-                        tile_map.set(x, y, tile)
-            elif layer["type"] == "objectgroup" and layer["name"] == "collision":
+            if layer["type"] == "objectgroup" and layer["name"] == "collision":
                 for obj in layer["objects"]:
                     tile_map.add_collision_box(
                         ObjectTile(
@@ -175,3 +359,76 @@ class TileMap:
                 for obj in layer["objects"]:
                     tile_map.fruit_spawns.append((obj["x"], obj["y"]))
         return tile_map
+
+    def to_bundle(self) -> bytes:
+        """Serialize the map into the bundle format read by `load_from_bundle`."""
+        meta = {
+            "layer_z": self.layer_z,
+            "blocked_tiles": sorted(self.blocked_tiles),
+            "tilesets": self.tilesets,
+            "collision_resolution": self.collision_grid.resolution,
+            "collision_boxes": [
+                [box.id, box.x, box.y, box.width, box.height, box.passable] for box in self.collision_boxes
+            ],
+            "player_spawn": self.player_spawn,
+            "zombie_spawns": self.zombie_spawns,
+            "altars": self.altars,
+            "puzzle": self.puzzle,
+            "fruit_spawns": self.fruit_spawns,
+        }
+        meta_bytes = json.dumps(meta, separators=(",", ":")).encode()
+        meta_bytes += b" " * (-len(meta_bytes) % 4)  # keeps the gids 4-byte aligned
+        gids = array("I", self.gids)
+        if sys.byteorder == "big":
+            gids.byteswap()
+        header = BUNDLE_HEADER.pack(
+            BUNDLE_MAGIC,
+            BUNDLE_VERSION,
+            self.width,
+            self.height,
+            self.tile_size,
+            self.layers,
+            len(meta_bytes),
+        )
+        return header + meta_bytes + gids.tobytes() + bytes(self.flags) + self.collision_grid.pack()
+
+    @classmethod
+    def load_from_bundle(cls, data: bytes) -> TileMap:
+        """Load a map compiled by `to_bundle`.
+
+        The tile layers, cell flags and collision grid are copied in as whole arrays,
+        so the load time doesn't grow with the map area.
+        """
+        view = memoryview(data)
+        magic, version, width, height, tile_size, layers, meta_size = BUNDLE_HEADER.unpack_from(view)
+        if magic != BUNDLE_MAGIC or version != BUNDLE_VERSION:
+            msg = f"Not a version {BUNDLE_VERSION} map bundle"
+            raise ValueError(msg)
+        offset = BUNDLE_HEADER.size
+        meta = json.loads(bytes(view[offset : offset + meta_size]))
+        offset += meta_size
+
+        tile_map = cls(width=width, height=height, tile_size=tile_size, layers=0)
+        cells = width * height
+        gids_end = offset + tile_map.gids.itemsize * layers * cells
+        tile_map.gids.frombytes(view[offset:gids_end])
+        if sys.byteorder == "big":
+            tile_map.gids.byteswap()
+        tile_map.layers = layers
+        tile_map.layer_z = meta["layer_z"]
+        tile_map.blocked_tiles = set(meta["blocked_tiles"])
+        tile_map.flags[:] = view[gids_end : gids_end + cells]
+
+        tile_map.collision_grid = CollisionGrid(width * tile_size, height * tile_size, meta["collision_resolution"])
+        tile_map.collision_grid.unpack(view[gids_end + cells :])
+        # the packed grid already has the boxes rasterized, they only need indexing
+        for box in meta["collision_boxes"]:
+            tile_map._index_collision_box(ObjectTile(*box))
+
+        tile_map.tilesets = meta["tilesets"]
+        tile_map.player_spawn = tuple(meta["player_spawn"])
+        tile_map.zombie_spawns = [tuple(spawn) for spawn in meta["zombie_spawns"]]
+        tile_map.altars = [tuple(altar) for altar in meta["altars"]]
+        tile_map.puzzle = tuple(meta["puzzle"])
+        tile_map.fruit_spawns = [tuple(spawn) for spawn in meta["fruit_spawns"]]
+        return tile_map
@@ -1,5 +1,66 @@
-from .sliding_tiles_puzzle import SlidingTilesPuzzle
+"""Puzzles, imported on demand.
 
+The puzzles need NumPy, which isn't loaded with the game. `PuzzleLoader` fetches
+it and imports the puzzle modules when a puzzle first opens, or in the
+background once the game is running.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib
+
+import pyodide_js
+from pyodide.ffi import to_js
+
+# Pyodide packages the puzzle modules import
+PUZZLE_PACKAGES = ("numpy",)
+
+# Puzzle kind -> module and class name
 puzzles = {
-    "sliding_tiles_puzzle": SlidingTilesPuzzle,
+    "sliding_tiles_puzzle": ("puzzles.sliding_tiles_puzzle", "SlidingTilesPuzzle"),
 }
+
+
+class PuzzleLoader:
+    """Loads the puzzle packages and classes once, without blocking the game loop."""
+
+    def __init__(self) -> None:
+        self._classes: dict[str, type] = {}
+        self._task: asyncio.Future | None = None
+        self._preload_task: asyncio.Future | None = None
+
+    @property
+    def is_loading(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    @property
+    def failed(self) -> bool:
+        """Check if loading finished with an error."""
+        return self._task is not None and self._task.done() and self._task.exception() is not None
+
+    def get(self, kind: str) -> type | None:
+        """Return the class of a puzzle kind, or None while it isn't loaded."""
+        return self._classes.get(kind)
+
+    def start(self) -> None:
+        """Start loading in the background, unless it already started or succeeded.
+
+        A load that failed, e.g. because the network was down, is retried.
+        """
+        if self._task is None or self.failed:
+            self._task = asyncio.ensure_future(self._load())
+
+    def preload(self, delay: float) -> None:
+        """Start loading after `delay` seconds, so it doesn't compete with the first frames."""
+        if self._task is None and self._preload_task is None:
+            self._preload_task = asyncio.ensure_future(self._start_after(delay))
+
+    async def _start_after(self, delay: float) -> None:
+        await asyncio.sleep(delay)
+        self.start()
+
+    async def _load(self) -> None:
+        await pyodide_js.loadPackage(to_js(list(PUZZLE_PACKAGES)))
+        for kind, (module, name) in puzzles.items():
+            self._classes[kind] = getattr(importlib.import_module(module), name)
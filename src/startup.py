@@ -0,0 +1,154 @@
+"""Startup instrumentation: phase timings, per-module import times and a startup budget.
+
+`js/index.js` installs the import timer before importing `main`, so this module
+must not import any game package itself. The report merges the phases recorded
+by `js/index.js` in `window.startupPhases` with the Python ones, and is printed
+and published as `window.startupReport`.
+"""
+
+from __future__ import annotations
+
+import sys
+from contextlib import contextmanager
+from importlib.abc import Loader, MetaPathFinder
+from typing import TYPE_CHECKING
+
+from js import Object, performance, window
+from pyodide.ffi import to_js
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Sequence
+    from importlib.machinery import ModuleSpec
+    from types import ModuleType
+
+# Milliseconds from page load until the game loop runs
+STARTUP_BUDGET_MS = 6000.0
+REPORTED_IMPORTS = 10  # slowest modules printed, the published report has them all
+
+
+class _TimedLoader(Loader):
+    """Wraps a module's loader to time its execution."""
+
+    def __init__(self, loader: Loader, timer: ImportTimer) -> None:
+        self._loader = loader
+        self._timer = timer
+
+    def __getattr__(self, name: str) -> object:
+        return getattr(self._loader, name)
+
+    def create_module(self, spec: ModuleSpec) -> ModuleType | None:
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module: ModuleType) -> None:
+        timer = self._timer
+        timer.stack.append(0.0)  # time spent in nested imports
+        start = performance.now()
+        try:
+            self._loader.exec_module(module)
+        finally:
+            total = performance.now() - start
+            nested = timer.stack.pop()
+            if timer.stack:
+                timer.stack[-1] += total
+            timer.modules[module.__name__] = (total, total - nested)
+
+
+class ImportTimer(MetaPathFinder):
+    """Records how long each newly imported module takes to execute.
+
+    Times are in milliseconds, in total and without the modules it imports itself.
+    """
+
+    def __init__(self) -> None:
+        self.modules: dict[str, tuple[float, float]] = {}
+        self.stack: list[float] = []
+
+    def find_spec(
+        self,
+        fullname: str,
+        path: Sequence[str] | None,
+        target: ModuleType | None = None,
+    ) -> ModuleSpec | None:
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is not None:
+                if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+                    spec.loader = _TimedLoader(spec.loader, self)
+                return spec
+        return None
+
+
+class StartupProfiler:
+    """Collects the startup phases and module import times into one report."""
+
+    def __init__(self, budget_ms: float = STARTUP_BUDGET_MS) -> None:
+        self.budget_ms = budget_ms
+        self.phases: list[dict] = []
+        self.import_timer = ImportTimer()
+        self.report: dict | None = None
+
+    def install_import_timer(self) -> None:
+        """Start timing the modules imported from now on."""
+        if self.import_timer not in sys.meta_path:
+            sys.meta_path.insert(0, self.import_timer)
+
+    def remove_import_timer(self) -> None:
+        if self.import_timer in sys.meta_path:
+            sys.meta_path.remove(self.import_timer)
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time the enclosed block as a named startup phase."""
+        start = performance.now()
+        try:
+            yield
+        finally:
+            self.phases.append(
+                {"name": name, "source": "python", "start_ms": start, "duration_ms": performance.now() - start},
+            )
+
+    def finish(self) -> dict:
+        """Stop timing imports, then build, print and publish the report."""
+        self.remove_import_timer()
+        total_ms = performance.now()
+        js_phases = getattr(window, "startupPhases", None)
+        if hasattr(js_phases, "to_py"):
+            js_phases = js_phases.to_py()
+        phases = [{"source": "js", **phase} for phase in js_phases or []]
+        imports = sorted(
+            (
+                {"module": name, "total_ms": total, "self_ms": own}
+                for name, (total, own) in self.import_timer.modules.items()
+            ),
+            key=lambda entry: -entry["self_ms"],
+        )
+        self.report = {
+            "total_ms": total_ms,
+            "budget_ms": self.budget_ms,
+            "over_budget": total_ms > self.budget_ms,
+            "phases": sorted(phases + self.phases, key=lambda phase: phase["start_ms"]),
+            "imports": imports,
+        }
+        print(self.format())
+        window.startupReport = to_js(self.report, dict_converter=Object.fromEntries)
+        return self.report
+
+    def format(self) -> str:
+        """Return the report as a human readable summary."""
+        report = self.report
+        lines = [f"startup: {report['total_ms']:.1f} ms of a {report['budget_ms']:.0f} ms budget"]
+        if report["over_budget"]:
+            lines[0] += f", OVER BUDGET by {report['total_ms'] - report['budget_ms']:.1f} ms"
+        lines.extend(
+            f"  {phase['source']:<6} {phase['name']:<24} {phase['duration_ms']:8.1f} ms" for phase in report["phases"]
+        )
+        lines.append(f"slowest of {len(report['imports'])} imports (self time):")
+        lines.extend(
+            f"  {entry['module']:<32} {entry['self_ms']:8.1f} ms" for entry in report["imports"][:REPORTED_IMPORTS]
+        )
+        return "\n".join(lines)
+
+
+profiler = StartupProfiler()
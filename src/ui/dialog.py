@@ -1,10 +1,20 @@
 from collections.abc import Callable
+from typing import ClassVar
 
 from js import document
 
+from engine.proxies import proxy_manager
+
 
 class DialogBox:
-    """Represents a dialog box with text and options."""
+    """Represents a dialog box with text and options.
+
+    The `.dialog-btn` elements are shared by every dialog, their click handlers
+    are bound once and forward to the dialog currently shown.
+    """
+
+    _shown: ClassVar["DialogBox | None"] = None
+    _button_proxies: ClassVar[list] = []
 
     def __init__(
         self,
@@ -27,16 +37,13 @@ class DialogBox:
             dialog_message.textContent = self.text
 
         dialog_options = document.querySelectorAll(".dialog-btn")
+        DialogBox._shown = self
+        DialogBox._bind_buttons(dialog_options)
         for i, option in enumerate(dialog_options):
             if i < len(self.options):
                 option.textContent = self.options[i]
                 option.style.display = "inline-block"
                 option.value = self.options[i]
-
-                def make_click_handler(option_value: str):
-                    return lambda _event: self._on_option_click(option_value)
-
-                option.onclick = make_click_handler(self.options[i])
             else:
                 option.style.display = "none"
 
@@ -44,8 +51,31 @@ class DialogBox:
         if dialog:
             dialog.style.display = "flex"
 
-    def _on_option_click(self, value: str) -> None:
-        """Handle option click events."""
+    @classmethod
+    def _bind_buttons(cls, buttons: list) -> None:
+        """Attach a click handler to the buttons that don't have one yet."""
+        for i in range(len(cls._button_proxies), len(buttons)):
+            proxy = proxy_manager.create(lambda _event, index=i: cls._on_button_click(index))
+            buttons[i].onclick = proxy
+            cls._button_proxies.append(proxy)
+
+    @classmethod
+    def unbind_buttons(cls) -> None:
+        """Detach the shared click handlers and release their proxies."""
+        for button, proxy in zip(document.querySelectorAll(".dialog-btn"), cls._button_proxies, strict=False):
+            button.onclick = None
+            proxy_manager.destroy(proxy)
+        cls._button_proxies = []
+        cls._shown = None
+
+    @classmethod
+    def _on_button_click(cls, index: int) -> None:
+        dialog = cls._shown
+        if dialog and index < len(dialog.options):
+            dialog.choose_option(dialog.options[index])
+
+    def choose_option(self, value: str) -> None:
+        """Answer the dialog with `value` and hide it."""
         if self.callback:
             self.callback(value)
         dialog = document.getElementById("dialog")
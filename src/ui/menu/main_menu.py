@@ -1,7 +1,6 @@
-from js import document, performance
+from js import document
 
 from engine.event_bus import EventBus, EventType, GameEvent
-from engine.state import DelayState
 
 VISIBLE_CLASS = "visible"
 
@@ -32,7 +31,6 @@ class MainMenu:
 
     def _new_game_btn_onclick(self) -> None:
         self.hide()
-        DelayState.set_delay(performance.now())
         # more stuff to be done here
         self.event_bus.post(
             GameEvent(
@@ -2,8 +2,6 @@ from dataclasses import dataclass
 
 from js import document
 
-from engine.event_bus import EventType, GameEvent
-
 
 @dataclass
 class StatusBar:
@@ -15,7 +13,7 @@ class StatusBar:
     max_intelligence: int = 100
     fatigue: int = 0
     max_fatigue: int = 100
-    ticks: int = 0  # in-game ticks
+    play_time: float = 0.0  # in-game seconds
     hide: bool = True  # whether to hide the status bar
 
     def update(
@@ -23,25 +21,18 @@ class StatusBar:
         hp: int,
         intelligence: int,
         fatigue: int,
-        ticks: int | None = None,
-        events: list[GameEvent] | None = None,
+        play_time: float | None = None,
+        hide: bool | None = None,
     ) -> None:
         self.hp = hp
         self.intelligence = intelligence
         self.fatigue = fatigue
 
-        if ticks is not None:
-            self.ticks = ticks
-
-        if not events:
-            self.events = []
+        if play_time is not None:
+            self.play_time = play_time
 
-        for event in events:
-            if event.event_type == EventType.GAME_PAUSED:
-                self.hide = True
-            elif event.event_type == EventType.GAME_RESUMED:
-                print("Resuming game, showing status bar")
-                self.hide = False
+        if hide is not None:
+            self.hide = hide
 
     def update_ui(self) -> None:
         """Update the UI elements for the status bar."""
@@ -68,12 +59,12 @@ class StatusBar:
 
         timer_element = document.querySelector("#game-timer .val")
         if timer_element:
-            timer_element.textContent = format_game_time(self.ticks)
+            timer_element.textContent = format_game_time(self.play_time)
 
 
-def format_game_time(ticks: float) -> str:
-    """Convert game ticks to a formatted time string (HH:MM:SS)."""
-    seconds = ticks // 1000
+def format_game_time(play_time: float) -> str:
+    """Convert in-game seconds to a formatted time string (HH:MM:SS)."""
+    seconds = play_time // 1
     minutes = seconds // 60
     hours = minutes // 60
     seconds = seconds % 60
@@ -1,3 +1,4 @@
+from .chunk_cache import TileChunkCache
 from .view_bridge import ViewBridge
 
-__all__ = ["ViewBridge"]
+__all__ = ["TileChunkCache", "ViewBridge"]
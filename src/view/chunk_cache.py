@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import math
+from collections import OrderedDict
+from typing import TYPE_CHECKING
+
+from js import document
+
+if TYPE_CHECKING:
+    from js import HTMLCanvasElement
+
+    from models.tile import TileMap, TilesRegistry
+
+CHUNK_TILES = 8  # chunk side length in tiles
+CHUNK_CAPACITY = 64  # max pre-rendered chunks kept alive
+
+
+class TileChunkCache:
+    """LRU cache of pre-rendered blocks of the static tile layers.
+
+    Each chunk is a ``CHUNK_TILES`` x ``CHUNK_TILES`` block of every tile layer,
+    drawn once into an offscreen canvas at a given zoom. The renderer then blits
+    a handful of chunks per frame instead of one image per tile per layer.
+    """
+
+    def __init__(
+        self,
+        tile_map: TileMap,
+        tiles_registry: TilesRegistry,
+        chunk_tiles: int = CHUNK_TILES,
+        capacity: int = CHUNK_CAPACITY,
+    ) -> None:
+        self.tile_map = tile_map
+        self.tiles_registry = tiles_registry
+        self.chunk_tiles = chunk_tiles
+        self.chunk_size = chunk_tiles * tile_map.tile_size  # in world pixels
+        self.capacity = capacity
+        self._chunks: OrderedDict[tuple[int, int, float], HTMLCanvasElement] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._chunks)
+
+    def get(self, chunk_x: int, chunk_y: int, zoom: float) -> HTMLCanvasElement | None:
+        """Return the canvas for a chunk, rendering it on a cache miss.
+
+        Returns None while the tileset images are still loading, so that a blank
+        chunk never ends up in the cache.
+        """
+        key = (chunk_x, chunk_y, zoom)
+        canvas = self._chunks.get(key)
+        if canvas is not None:
+            self._chunks.move_to_end(key)
+            return canvas
+
+        if not self.tiles_registry.is_loaded():
+            return None
+
+        canvas = self._render_chunk(chunk_x, chunk_y, zoom)
+        self._chunks[key] = canvas
+        while len(self._chunks) > self.capacity:
+            _, evicted = self._chunks.popitem(last=False)
+            # shrink the backing store so the browser can free it right away
+            evicted.width = 0
+            evicted.height = 0
+        return canvas
+
+    def pixel_size(self, zoom: float) -> int:
+        """Side length of a chunk canvas rendered at `zoom`, in screen pixels."""
+        return math.ceil(self.chunk_size * zoom)
+
+    def clear(self) -> None:
+        """Drop every cached chunk, e.g. after the tile map changed."""
+        for canvas in self._chunks.values():
+            canvas.width = 0
+            canvas.height = 0
+        self._chunks.clear()
+
+    def _render_chunk(self, chunk_x: int, chunk_y: int, zoom: float) -> HTMLCanvasElement:
+        tile_map = self.tile_map
+        tile_size = tile_map.tile_size
+
+        canvas = document.createElement("canvas")
+        canvas.width = self.pixel_size(zoom)
+        canvas.height = self.pixel_size(zoom)
+
+        start_x = chunk_x * self.chunk_tiles
+        start_y = chunk_y * self.chunk_tiles
+        end_x = min(start_x + self.chunk_tiles, tile_map.width)
+        end_y = min(start_y + self.chunk_tiles, tile_map.height)
+
+        ctx = canvas.getContext("2d", alpha=True)
+        for layer in range(tile_map.layers):
+            for y in range(start_y, end_y):
+                for x in range(start_x, end_x):
+                    gid = tile_map.gid_at(layer, x, y)
+                    if not gid:
+                        continue
+                    self.tiles_registry.blit(
+                        ctx,
+                        gid,
+                        int((x - start_x) * tile_size * zoom),
+                        int((y - start_y) * tile_size * zoom),
+                        zoom,
+                    )
+
+        return canvas
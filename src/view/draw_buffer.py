@@ -0,0 +1,110 @@
+"""Batched image drawing: one Python -> JS call per run of draws instead of several per draw."""
+
+from __future__ import annotations
+
+from array import array
+from typing import TYPE_CHECKING
+
+from js import Float32Array, window
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable
+
+    from js import CanvasRenderingContext2D, Image
+
+# Floats per record: image id, source rect (x, y, w, h), destination rect (x, y, w, h),
+# rotation in radians and opacity. A source width <= 0 draws the whole image.
+RECORD_SIZE = 11
+DEFAULT_CAPACITY = 1024  # records
+
+
+class ImageTable:
+    """Assigns small integer ids to the images drawn through a `DrawBuffer`.
+
+    The JS executor looks images up by id, so each image crosses the FFI once,
+    when it is first registered, instead of with every draw.
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[Hashable, tuple[int, Image]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def id_for(self, key: Hashable, image: Image) -> int:
+        """Return the id of the image registered under `key`, (re-)registering it if needed.
+
+        Re-registering a key with a new image, e.g. a re-rendered chunk canvas, keeps its id.
+        """
+        entry = self._entries.get(key)
+        if entry is not None and entry[1] is image:
+            return entry[0]
+        image_id = entry[0] if entry is not None else len(self._entries)
+        self._entries[key] = (image_id, image)
+        window.registerDrawImage(image_id, image)
+        return image_id
+
+
+class DrawBuffer:
+    """A frame's image draws packed into a flat float array.
+
+    `flush` copies the records into a JS `Float32Array` and replays them with
+    `executeDrawBuffer` from `js/index.js`.
+    """
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY) -> None:
+        self.data = array("f", bytes(4 * RECORD_SIZE * capacity))
+        self.count = 0
+        self._js_data = None
+
+    @property
+    def capacity(self) -> int:
+        """Number of records that fit without growing."""
+        return len(self.data) // RECORD_SIZE
+
+    def add(
+        self,
+        image_id: int,
+        sx: float,
+        sy: float,
+        sw: float,
+        sh: float,
+        dx: float,
+        dy: float,
+        dw: float,
+        dh: float,
+        rotation: float = 0.0,
+        opacity: float = 1.0,
+    ) -> None:
+        """Append one `drawImage` record."""
+        if self.count == self.capacity:
+            # double the capacity, the JS side array is reallocated on the next flush
+            self.data.extend(self.data)
+        # written field by field into the preallocated storage, a record allocates nothing
+        data = self.data
+        start = self.count * RECORD_SIZE
+        data[start] = image_id
+        data[start + 1] = sx
+        data[start + 2] = sy
+        data[start + 3] = sw
+        data[start + 4] = sh
+        data[start + 5] = dx
+        data[start + 6] = dy
+        data[start + 7] = dw
+        data[start + 8] = dh
+        data[start + 9] = rotation
+        data[start + 10] = opacity
+        self.count += 1
+
+    def flush(self, ctx: CanvasRenderingContext2D) -> int:
+        """Draw the buffered records on `ctx`, empty the buffer and return how many were drawn."""
+        count = self.count
+        if not count:
+            return 0
+        if self._js_data is None or self._js_data.length < len(self.data):
+            self._js_data = Float32Array.new(len(self.data))
+        size = count * RECORD_SIZE
+        self._js_data.subarray(0, size).assign(memoryview(self.data)[:size])
+        window.executeDrawBuffer(ctx, self._js_data, count)
+        self.count = 0
+        return count
@@ -1,19 +1,22 @@
 from __future__ import annotations
 
+import math
 from typing import TYPE_CHECKING
 
 import js
 from js import Image, document
-from pyodide.ffi import create_proxy
 
 from engine.input_system import InputEvent, InputSystem, InputType
+from engine.proxies import proxy_manager
 from models.draw_cmd import DrawCmdType
+from view.draw_buffer import DrawBuffer, ImageTable
 
 if TYPE_CHECKING:
     from js import HTMLCanvasElement
 
     from models.draw_cmd import DrawCmd
     from models.tile import TilesRegistry
+    from view.chunk_cache import TileChunkCache
 
 ALLOWED_INPUTS = [
     "ArrowUp",
@@ -45,12 +48,16 @@ class ViewBridge:
         canvas: HTMLCanvasElement,
         input_sys: InputSystem,
         tiles_registry: TilesRegistry = None,
+        chunk_cache: TileChunkCache | None = None,
     ) -> None:
         self.canvas = canvas
         self.ctx = canvas.getContext("2d", alpha=True)
         self._image_cache = {}
         self.tiles_registry = tiles_registry
+        self.chunk_cache = chunk_cache
         self.input_sys = input_sys
+        self.draw_buffer = DrawBuffer()
+        self.image_table = ImageTable()
         self._setup_event_handler()
 
     def _setup_event_handler(self) -> None:
@@ -68,28 +75,43 @@ class ViewBridge:
                 self.input_sys.push_event(InputEvent(InputType.CLICK, None, (x, y)))
             evt.preventDefault()
 
-        self.key_down_proxy = create_proxy(on_key_down)
-        self.click_proxy = create_proxy(on_click)
+        self.key_down_proxy = proxy_manager.create(on_key_down)
+        self.click_proxy = proxy_manager.create(on_click)
 
         document.addEventListener("keydown", self.key_down_proxy)
         document.addEventListener("click", self.click_proxy)
 
+    def teardown(self) -> None:
+        """Remove the input listeners and release their proxies."""
+        document.removeEventListener("keydown", self.key_down_proxy)
+        document.removeEventListener("click", self.click_proxy)
+        proxy_manager.destroy(self.key_down_proxy)
+        proxy_manager.destroy(self.click_proxy)
+
     def draw(self, cmds: list[DrawCmd]) -> None:
-        """Send draw commands to the JS side for rendering."""
+        """Send draw commands to the JS side for rendering.
+
+        Sprite, tile and chunk draws are packed into the draw buffer and replayed by JS
+        in one call. The other commands, overlays and UI, are drawn on top of them
+        afterwards, so the buffer is flushed once per frame.
+        """
         # Clear canvas before drawing
         self.ctx.clearRect(0, 0, self.canvas.width, self.canvas.height)
 
-        # Process each draw command
+        overlays = []
         for cmd in cmds:
             if cmd.type == DrawCmdType.SPRITE:
-                cmd.sprite.draw(
-                    self.canvas,
-                    self._load_image(cmd.sprite.image_path),
-                    cmd,
-                )
+                self.encode_sprite(cmd)
             elif cmd.type == DrawCmdType.TILE:
-                self.tiles_registry.draw_tile(self.canvas, cmd)
-            elif cmd.type == DrawCmdType.COLLISION:
+                self.encode_tile(cmd)
+            elif cmd.type == DrawCmdType.CHUNK:
+                self.encode_chunk(cmd)
+            else:
+                overlays.append(cmd)
+        self.draw_buffer.flush(self.ctx)
+
+        for cmd in overlays:
+            if cmd.type == DrawCmdType.COLLISION:
                 self.draw_collision_box(cmd)
             elif cmd.type == DrawCmdType.TEXT:
                 self.draw_text(
@@ -102,11 +124,66 @@ class ViewBridge:
             elif cmd.type == DrawCmdType.PUZZLE:
                 cmd.puzzle.draw(self.canvas)
 
+    def encode_sprite(self, cmd: DrawCmd) -> None:
+        """Buffer the current animation frame of a sprite."""
+        sprite = cmd.sprite
+        image_id = self.image_table.id_for(sprite.image_path, self._load_image(sprite.image_path))
+        w, h = sprite.size
+        # only single-frame sprites with a sheet of their own lack a rect, and draw the whole
+        # sheet; atlas sprites always have one, SpriteRegistry.load_from_json checks it
+        rect = sprite.frame_rect(cmd.frame_idx) or (0, 0, 0, 0)
+        self.draw_buffer.add(
+            image_id,
+            *rect,
+            cmd.position.x,
+            cmd.position.y,
+            w * cmd.scale,
+            h * cmd.scale,
+            math.radians(cmd.rotation),
+            cmd.opacity,
+        )
+
+    def encode_tile(self, cmd: DrawCmd) -> None:
+        """Buffer a single tile from its tileset."""
+        rect = self.tiles_registry.get_rect(cmd.tile_gid)
+        if rect is None:
+            return
+        image, source_x, source_y, width, height = rect
+        self.draw_buffer.add(
+            self.image_table.id_for(("tileset", id(image)), image),
+            source_x,
+            source_y,
+            width,
+            height,
+            cmd.position.x,
+            cmd.position.y,
+            width * cmd.scale,
+            height * cmd.scale,
+        )
+
+    def encode_chunk(self, cmd: DrawCmd) -> None:
+        """Buffer a pre-rendered block of tiles from the chunk cache."""
+        chunk = self.chunk_cache.get(*cmd.chunk, cmd.scale)
+        if chunk is None:
+            return
+        size = self.chunk_cache.pixel_size(cmd.scale)
+        self.draw_buffer.add(
+            self.image_table.id_for(("chunk", *cmd.chunk, cmd.scale), chunk),
+            0,
+            0,
+            size,
+            size,
+            cmd.position.x,
+            cmd.position.y,
+            size,
+            size,
+        )
+
     def draw_collision_box(self, cmd: DrawCmd) -> None:
         """Draw a semi-transparent rectangle for collision boxes."""
         position = cmd.position
         collision = cmd.collision_box
-        self.ctx.fillStyle = "rgba(128, 128, 128, 0)"
+        self.ctx.fillStyle = "rgba(128, 128, 128, 0.4)"
         self.ctx.fillRect(
             position.x,
             position.y,
@@ -151,6 +228,12 @@ class ViewBridge:
 
         return self._image_cache[path]
 
+    def add_images(self, images: dict[str, Image]) -> None:
+        """Use already loaded images for these paths and register them for drawing."""
+        for path, image in images.items():
+            self._image_cache[path] = image
+            self.image_table.id_for(path, image)
+
     def load_assets(self, index_path: str) -> None:
         """Load assets from a given index path."""
         # This would load assets via JS
@@ -0,0 +1,120 @@
+"""Pack the sprite sheets referenced by `assets/db/*.json` into atlas images.
+
+Writes the atlas pages and a manifest of named frame rects that
+`SpriteRegistry.load_from_json` reads, e.g. from the repository root:
+`python tools/build_atlas.py`. Needs Pillow (`poetry install --with dev`).
+
+Each sheet is packed once, however many sprite states use it, with transparent
+padding around it so filtered draws don't bleed into the neighbouring sheet.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+
+from PIL import Image
+
+DEFAULT_DB_DIR = Path("assets/db")
+DEFAULT_OUTPUT_DIR = Path("assets/atlas")
+DEFAULT_NAME = "sprites"
+MAX_PAGE_SIZE = 1024  # pixels, well within every browser's canvas and texture limits
+PADDING = 2  # pixels around each sheet
+
+
+def load_sprite_dbs(db_dir: Path) -> list[dict]:
+    """Return the sprite definitions, ordered by file name for a stable output."""
+    return [json.loads(path.read_text()) for path in sorted(db_dir.glob("*.json"))]
+
+
+def referenced_sheets(sprite_dbs: list[dict]) -> list[str]:
+    """Return the distinct sheet paths the sprite definitions refer to."""
+    sheets = {info["image_path"] for data in sprite_dbs for info in data["state"].values()}
+    return sorted(sheets)
+
+
+def pack(sizes: dict[str, tuple[int, int]], max_size: int = MAX_PAGE_SIZE) -> dict[str, tuple[int, int, int]]:
+    """Place the rectangles on shelves, tallest first, opening a new page when one is full.
+
+    Return `{key: (page, x, y)}` of the top left corner of each rectangle, padding included.
+    """
+    placements = {}
+    page = x = y = shelf_height = 0
+    for key in sorted(sizes, key=lambda key: (-sizes[key][1], -sizes[key][0], key)):
+        width, height = (side + 2 * PADDING for side in sizes[key])
+        if width > max_size or height > max_size:
+            msg = f"{key} is larger than an atlas page of {max_size}x{max_size}"
+            raise ValueError(msg)
+        if x + width > max_size:
+            x, y, shelf_height = 0, y + shelf_height, 0
+        if y + height > max_size:
+            page, x, y, shelf_height = page + 1, 0, 0, 0
+        placements[key] = (page, x, y)
+        x += width
+        shelf_height = max(shelf_height, height)
+    return placements
+
+
+def frame_rects(info: dict, origin: tuple[int, int], sheet_size: tuple[int, int]) -> list[list[int]]:
+    """Return the atlas rects of a sprite state's frames, in animation order.
+
+    Animated sprites are strips of `width` wide frames, others use the whole sheet.
+    """
+    x, y = origin
+    sheet_width, sheet_height = sheet_size
+    if not info.get("loop", False):
+        return [[x, y, sheet_width, sheet_height]]
+    width, height = info["width"], info["height"]
+    frame_count = max(1, min(info["frame_count"], sheet_width // width))
+    return [[x + i * width, y, width, height] for i in range(frame_count)]
+
+
+def build_atlas(db_dir: Path, output_dir: Path, name: str = DEFAULT_NAME) -> dict:
+    """Write the atlas pages and manifest to `output_dir` and return the manifest."""
+    sprite_dbs = load_sprite_dbs(db_dir)
+    sheets = {path: Image.open(path).convert("RGBA") for path in referenced_sheets(sprite_dbs)}
+    placements = pack({path: sheet.size for path, sheet in sheets.items()})
+
+    page_count = max((page for page, _, _ in placements.values()), default=-1) + 1
+    page_sizes = [[0, 0] for _ in range(page_count)]
+    for path, (page, x, y) in placements.items():
+        width, height = sheets[path].size
+        page_sizes[page][0] = max(page_sizes[page][0], x + width + 2 * PADDING)
+        page_sizes[page][1] = max(page_sizes[page][1], y + height + 2 * PADDING)
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    pages = [Image.new("RGBA", tuple(size), (0, 0, 0, 0)) for size in page_sizes]
+    for path, (page, x, y) in placements.items():
+        pages[page].paste(sheets[path], (x + PADDING, y + PADDING))
+    images = []
+    for i, page_image in enumerate(pages):
+        page_path = output_dir / f"{name}_{i}.png"
+        page_image.save(page_path, optimize=True)
+        images.append(page_path.as_posix())
+
+    sprites = {}
+    for data in sprite_dbs:
+        states = sprites.setdefault(data["name"], {})
+        for state, info in data["state"].items():
+            page, x, y = placements[info["image_path"]]
+            states[state] = {
+                "image": page,
+                "frames": frame_rects(info, (x + PADDING, y + PADDING), sheets[info["image_path"]].size),
+            }
+
+    manifest = {"images": images, "sprites": sprites}
+    (output_dir / f"{name}.json").write_text(json.dumps(manifest, indent=2) + "\n")
+    return manifest
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--db", type=Path, default=DEFAULT_DB_DIR, help="directory of the sprite definitions")
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT_DIR, help="directory to write the atlas to")
+    parser.add_argument("--name", default=DEFAULT_NAME, help="base name of the atlas files")
+    args = parser.parse_args()
+
+    manifest = build_atlas(args.db, args.output, args.name)
+    frame_count = sum(len(state["frames"]) for states in manifest["sprites"].values() for state in states.values())
+    print(f"packed {frame_count} frames into {', '.join(manifest['images'])}")
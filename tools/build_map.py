@@ -0,0 +1,44 @@
+"""Compile Tiled `.tmj` maps into the binary bundles `TileMap.load_from_bundle` reads.
+
+Each bundle is written next to its map with a `.tmb` suffix, e.g. from the
+repository root: `python tools/build_map.py assets/tilemap/cj.tmj`. The map is
+loaded with the game's own `TileMap.load_from_tiled`, through the headless
+backend, so the bundle holds exactly what the game would have built.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+import headless
+
+headless.install()
+
+import engine  # noqa: E402, F401 - imports the game packages in the order main does
+from models.tile import TileMap  # noqa: E402
+
+DEFAULT_MAPS = (Path("assets/tilemap/cj.tmj"),)
+BUNDLE_SUFFIX = ".tmb"
+
+
+def build_map(path: Path) -> Path:
+    """Compile one map and return the path of its bundle."""
+    tile_map = TileMap.load_from_tiled(json.loads(path.read_text()))
+    output = path.with_suffix(BUNDLE_SUFFIX)
+    output.write_bytes(tile_map.to_bundle())
+    return output
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("maps", nargs="*", type=Path, default=DEFAULT_MAPS, help="Tiled maps to compile")
+    args = parser.parse_args()
+
+    for path in args.maps:
+        output = build_map(path)
+        print(f"compiled {path} ({path.stat().st_size} bytes) -> {output} ({output.stat().st_size} bytes)")